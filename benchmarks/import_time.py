@@ -0,0 +1,94 @@
+"""
+Checks that importing `gatepoint` stays within a time budget and never
+imports more than it needs. Each run uses a fresh interpreter so nothing
+is already imported. Two things are measured:
+
+- `components`: `import gatepoint` and building components, which must not
+  import the server, HTTP or signing stack.
+- `client`: accessing `gatepoint.GatewayClient`, which must not import the
+  HTTP client or server until a session is started or `run()` is called.
+
+Exits with status 1 when a budget is exceeded or a heavy module is imported.
+
+    python benchmarks/import_time.py [components_budget_ms] [runs] [client_budget_ms]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("aiohttp", "fastapi", "uvicorn", "nacl", "requests")
+
+CHECKS = {
+    "components": {
+        "code": """
+import gatepoint
+gatepoint.ActionRow(gatepoint.Button("Hello", "hello"))
+gatepoint.Embed(title = "Hello")
+""",
+        "budget_ms": 150.0,
+        "heavy": HEAVY_MODULES
+    },
+    "client": {
+        "code": """
+import gatepoint
+gatepoint.GatewayClient
+""",
+        "budget_ms": 300.0,
+        # Signature verification needs nacl as soon as a client exists.
+        "heavy": ("aiohttp", "fastapi", "uvicorn", "requests")
+    }
+}
+
+SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "heavy": [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure(check: str = "components") -> dict:
+    """Imports gatepoint in a fresh interpreter, returning the time taken in
+    milliseconds and the heavy modules that were imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", SNIPPET.format(code = CHECKS[check]["code"], heavy = CHECKS[check]["heavy"])],
+        cwd = ROOT,
+        capture_output = True,
+        text = True,
+        check = True
+    )
+    return json.loads(result.stdout)
+
+def best(check: str, runs: int) -> dict:
+    results = [measure(check) for _ in range(runs)]
+    return {
+        "best_ms": round(min(result["ms"] for result in results), 2),
+        "heavy_imports": sorted({name for result in results for name in result["heavy"]})
+    }
+
+def main():
+    budgets = {
+        "components": float(sys.argv[1]) if len(sys.argv) > 1 else CHECKS["components"]["budget_ms"],
+        "client": float(sys.argv[3]) if len(sys.argv) > 3 else CHECKS["client"]["budget_ms"]
+    }
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    report = {"runs": runs}
+    failed = False
+    for check, budget in budgets.items():
+        report[check] = {**best(check, runs), "budget_ms": budget}
+        failed = failed or report[check]["best_ms"] > budget or bool(report[check]["heavy_imports"])
+
+    print(json.dumps(report, indent = 4))
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
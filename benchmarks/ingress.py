@@ -0,0 +1,242 @@
+"""
+End-to-end ingress benchmark. Signed synthetic payloads are pushed through
+each stage of handling an interaction, then through the whole endpoint
+in-process and over a local socket:
+
+- `verify`: Ed25519 signature check.
+- `parse`: decoding the body.
+- `dispatch`: routing and running the handler.
+- `encode`: encoding the response.
+- `process`: all of the above, as `GatewayClient.process`.
+- `asgi`: `InteractionApp` called in-process.
+- `socket`: HTTP requests to uvicorn on 127.0.0.1.
+
+Each stage reports throughput, p50/p99 latency and the peak memory
+allocated per request, as JSON for comparison between releases.
+
+    python benchmarks/ingress.py [--iterations N] [--socket-iterations N] [--no-socket] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import sys
+import time
+import tracemalloc
+
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Import gatepoint from this checkout when run as `python benchmarks/ingress.py`.
+sys.path.insert(0, ROOT)
+
+import payloads
+
+def build_client(public_key: str):
+    import gatepoint
+    from gatepoint import ChoiceIndex, GatewayClient, Member, OptionType, Reply
+
+    client = GatewayClient(
+        secret_key = "benchmark",
+        public_key = public_key,
+        token = "benchmark",
+        sync_commands = False,
+        identity_cache_path = None,
+        manifest_path = None,
+        # Payloads are signed once, before runs that may take longer than the window.
+        timestamp_window = None
+    )
+
+    @client.add_option(OptionType.STRING, "text", "Text to echo.", required = True)
+    @client.add_option(OptionType.INTEGER, "times", "Times to echo it.")
+    @client.add_option(OptionType.USER, "target", "Who to echo it to.")
+    @client.command("echo", description = "Echoes text.")
+    async def echo(interaction, text: str, times: int = 1, target: Member = None):
+        return interaction.reply(f"{target.user.username}: {text[:100] * times}")
+
+    voted = Reply("You voted {choice} in poll {poll}.", ephemeral = True)
+
+    @client.button("vote:{poll:int}:{choice}")
+    async def vote(interaction, poll: int, choice: str):
+        return voted.render(poll = poll, choice = choice)
+
+    @client.menu("pick")
+    async def pick(interaction, values: list):
+        return interaction.reply(f"Picked {len(values)} options.", ephemeral = True)
+
+    cities = ChoiceIndex(payloads.city_names(50000))
+
+    @client.autocompleter("city", "name", cache = False)
+    async def city(interaction, value: str):
+        return cities
+
+    @client.command("city", description = "Looks up a city.")
+    async def city_command(interaction, name: str):
+        return interaction.reply(name)
+
+    return client, gatepoint.__version__
+
+async def measure(func: Callable, iterations: int, warmup: int, allocation_iterations: int) -> dict:
+    async def call():
+        result = func()
+        if asyncio.iscoroutine(result):
+            await result
+
+    for _ in range(warmup):
+        await call()
+
+    timings = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await call()
+        timings.append(time.perf_counter_ns() - start)
+    elapsed = time.perf_counter() - started
+
+    # Measured separately, tracing allocations slows everything down.
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(allocation_iterations):
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await call()
+        allocated += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "iterations": iterations,
+        "per_second": round(iterations / elapsed, 1),
+        "p50_us": round(timings[len(timings) // 2] / 1000, 2),
+        "p99_us": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))] / 1000, 2),
+        "alloc_peak_bytes": allocated // max(allocation_iterations, 1)
+    }
+
+def asgi_call(app, body: bytes, signature: str, timestamp: str) -> Callable:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/interaction",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"x-signature-ed25519", signature.encode()),
+            (b"x-signature-timestamp", timestamp.encode())
+        ]
+    }
+    message = {"type": "http.request", "body": body, "more_body": False}
+
+    async def receive():
+        return message
+
+    async def send(message):
+        pass
+
+    return lambda: app(scope, receive, send)
+
+async def in_process(client, payload: dict, body: bytes, signature: str, timestamp: str, options) -> Dict[str, dict]:
+    runs = {
+        "verify": lambda: client.verifier.verify(signature, timestamp, body),
+        "parse": lambda: client.codec.loads(body),
+        "dispatch": lambda: client.dispatch(payload)
+    }
+    response = await client.dispatch(payload)
+    runs["encode"] = lambda: client.encode(response)
+    runs["process"] = lambda: client.process(signature, timestamp, body)
+    runs["asgi"] = asgi_call(client.asgi_app(), body, signature, timestamp)
+
+    return {
+        stage: await measure(func, options.iterations, options.warmup, options.allocation_iterations)
+        for stage, func in runs.items()
+    }
+
+async def over_socket(client, signed: Dict[str, tuple], options) -> Dict[str, dict]:
+    import aiohttp
+    import uvicorn
+
+    # asyncio only sets TCP_NODELAY on accepted sockets when the protocol is
+    # explicit, without it every response stalls on a delayed ACK.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    url = f"http://127.0.0.1:{sock.getsockname()[1]}/interaction"
+
+    # Lifespan is off so the client never contacts Discord.
+    server = uvicorn.Server(uvicorn.Config(client.asgi_app(), lifespan = "off", log_level = "critical", access_log = False))
+    serving = asyncio.ensure_future(server.serve(sockets = [sock]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    results = {}
+    async with aiohttp.ClientSession() as session:
+        for name, (body, signature, timestamp) in signed.items():
+            headers = {
+                "Content-Type": "application/json",
+                "X-Signature-Ed25519": signature,
+                "X-Signature-Timestamp": timestamp
+            }
+
+            async def post():
+                async with session.post(url, data = body, headers = headers) as response:
+                    await response.read()
+                    assert response.status == 200, response.status
+
+            results[name] = await measure(post, options.socket_iterations, options.warmup, options.allocation_iterations)
+
+    server.should_exit = True
+    await serving
+    return results
+
+async def run(options) -> dict:
+    signing_key, public_key = payloads.keypair()
+    client, version = build_client(public_key)
+
+    signed = {}
+    results: List[dict] = []
+    for name, payload in payloads.payloads().items():
+        if options.payload and name not in options.payload:
+            continue
+
+        body = payloads.encode(payload)
+        signature, timestamp = payloads.sign(signing_key, body)
+        signed[name] = (body, signature, timestamp)
+        for stage, result in (await in_process(client, payload, body, signature, timestamp, options)).items():
+            results.append({"payload": name, "size": len(body), "stage": stage, **result})
+
+    if not options.no_socket:
+        for name, result in (await over_socket(client, signed, options)).items():
+            results.append({"payload": name, "size": len(signed[name][0]), "stage": "socket", **result})
+
+    await client.shutdown()
+    return {
+        "gatepoint": version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "codec": client.codec.name,
+        "time": int(time.time()),
+        "results": results
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type = int, default = 5000, help = "Requests per in-process stage.")
+    parser.add_argument("--socket-iterations", type = int, default = 1000, help = "Requests per payload over the socket.")
+    parser.add_argument("--allocation-iterations", type = int, default = 200, help = "Requests traced for allocations.")
+    parser.add_argument("--warmup", type = int, default = 100, help = "Untimed requests before each stage.")
+    parser.add_argument("--payload", action = "append", help = "Only run this payload, may be repeated.")
+    parser.add_argument("--no-socket", action = "store_true", help = "Skip the local socket runs.")
+    parser.add_argument("--output", help = "Write the results to this file instead of stdout.")
+    options = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(options)), indent = 4)
+    if options.output:
+        with open(options.output, "w") as f:
+            f.write(report)
+
+    else:
+        print(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Compares the memory used by the slotted models in `gatepoint.objects` with
+the old representation, which subclassed `dict` and stored every field as
+an instance attribute.
+
+    python benchmarks/models_memory.py [count]
+"""
+
+import json
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Import gatepoint from this checkout when run as `python benchmarks/models_memory.py`.
+sys.path.insert(0, ROOT)
+
+from gatepoint.objects import Member
+
+USER_PAYLOAD = {
+    "id": "80351110224678912",
+    "username": "Nelly",
+    "discriminator": "1337",
+    "avatar": "8342729096ea3675442027381ff50dfe",
+    "public_flags": 64
+}
+
+MEMBER_PAYLOAD = {
+    "user": USER_PAYLOAD,
+    "nick": "NOT API SUPPORT",
+    "roles": [],
+    "joined_at": "2015-04-26T06:26:56.936000+00:00",
+    "deaf": False,
+    "mute": False
+}
+
+class LegacyUser(dict):
+    def __init__(self, username, discriminator, id, avatar = None, bot = False, system = False,
+            mfa_enabled = False, locale = None, verified = False, email = None, flags = None,
+            premium_type = None, public_flags = None):
+        self.username = username
+        self.discriminator = discriminator
+        self.id = id
+        self.avatar = avatar
+        self.bot = bot
+        self.system = system
+        self.mfa_enabled = mfa_enabled
+        self.locale = locale
+        self.verified = verified
+        self.email = email
+        self.flags = flags
+        self.premium_type = premium_type
+        self.public_flags = public_flags
+
+class LegacyMember(dict):
+    def __init__(self, user, nick = None, roles = None, joined_at = None, premium_since = None,
+            deaf = False, mute = False, pending = False):
+        self.user = user
+        self.nick = nick
+        self.roles = roles
+        self.joined_at = joined_at
+        self.premium_since = premium_since
+        self.deaf = deaf
+        self.mute = mute
+        self.pending = pending
+
+def legacy_member(payload: dict) -> LegacyMember:
+    fields = dict(payload)
+    fields["user"] = LegacyUser(**payload["user"])
+    return LegacyMember(**fields)
+
+def measure(build, count: int) -> int:
+    tracemalloc.start()
+    objects = [build(MEMBER_PAYLOAD) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    legacy = measure(legacy_member, count)
+    slotted = measure(Member.from_payload, count)
+    print(json.dumps({
+        "count": count,
+        "legacy_bytes_per_member": legacy / count,
+        "slotted_bytes_per_member": slotted / count,
+        "reduction": 1 - slotted / legacy
+    }, indent = 4))
+
+if __name__ == "__main__":
+    main()
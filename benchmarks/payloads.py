@@ -0,0 +1,146 @@
+"""
+Signed synthetic interaction payloads shared by the benchmarks. Payloads
+mirror what Discord sends, in a small and a large variant, and are signed
+with a throwaway Ed25519 key so verification runs for real.
+"""
+
+import json
+import time
+
+from typing import Dict, List, Tuple
+
+from nacl.signing import SigningKey
+
+APPLICATION_ID = "1000000000000000000"
+GUILD_ID = "1000000000000000001"
+CHANNEL_ID = "1000000000000000002"
+
+def keypair() -> Tuple[SigningKey, str]:
+    """Returns a new signing key and its public key as hex."""
+    signing_key = SigningKey.generate()
+    return signing_key, signing_key.verify_key.encode().hex()
+
+def sign(signing_key: SigningKey, body: bytes) -> Tuple[str, str]:
+    """Returns the `X-Signature-Ed25519` and `X-Signature-Timestamp` of a body."""
+    timestamp = str(int(time.time()))
+    signature = signing_key.sign(timestamp.encode() + body).signature.hex()
+    return signature, timestamp
+
+def user(index: int) -> dict:
+    return {
+        "id": str(2000000000000000000 + index),
+        "username": f"user{index}",
+        "discriminator": "0",
+        "global_name": f"User {index}",
+        "avatar": "8342729096ea3675442027381ff50dfe",
+        "public_flags": 64
+    }
+
+def member(index: int) -> dict:
+    return {
+        "user": user(index),
+        "nick": None,
+        "roles": [str(3000000000000000000 + role) for role in range(index % 8)],
+        "joined_at": "2015-04-26T06:26:56.936000+00:00",
+        "premium_since": None,
+        "deaf": False,
+        "mute": False,
+        "pending": False,
+        "permissions": "2147483647"
+    }
+
+def envelope(type_: int, data: dict, index: int = 0) -> dict:
+    return {
+        "type": type_,
+        "id": str(4000000000000000000 + index),
+        "application_id": APPLICATION_ID,
+        "token": "aW50ZXJhY3Rpb246YmVuY2htYXJr" * 4,
+        "version": 1,
+        "guild_id": GUILD_ID,
+        "channel_id": CHANNEL_ID,
+        "member": member(index),
+        "locale": "en-US",
+        "guild_locale": "en-US",
+        "app_permissions": "2147483647",
+        "data": data
+    }
+
+def ping() -> dict:
+    return {
+        "type": 1,
+        "id": "4000000000000000000",
+        "application_id": APPLICATION_ID,
+        "token": "aW50ZXJhY3Rpb246YmVuY2htYXJr",
+        "version": 1
+    }
+
+def command(users: int) -> dict:
+    """`/echo` with text, number and user options, resolving `users` members."""
+    resolved_users = {user(index)["id"]: user(index) for index in range(users)}
+    resolved_members = {}
+    for index in range(users):
+        resolved = member(index)
+        del resolved["user"]
+        resolved_members[user(index)["id"]] = resolved
+
+    return envelope(2, {
+        "id": "5000000000000000000",
+        "name": "echo",
+        "type": 1,
+        "options": [
+            {"type": 3, "name": "text", "value": "Hello, world! " * (1 + users)},
+            {"type": 4, "name": "times", "value": 3},
+            {"type": 6, "name": "target", "value": user(0)["id"]}
+        ],
+        "resolved": {
+            "users": resolved_users,
+            "members": resolved_members
+        }
+    })
+
+def button() -> dict:
+    return envelope(3, {
+        "component_type": 2,
+        "custom_id": "vote:42:yes"
+    })
+
+def select(values: int) -> dict:
+    return envelope(3, {
+        "component_type": 3,
+        "custom_id": "pick",
+        "values": [f"option-{index}" for index in range(values)]
+    })
+
+def autocomplete(query: str) -> dict:
+    return envelope(4, {
+        "id": "5000000000000000001",
+        "name": "city",
+        "type": 1,
+        "options": [
+            {"type": 3, "name": "name", "value": query, "focused": True}
+        ]
+    })
+
+def payloads() -> Dict[str, dict]:
+    """The benchmarked payloads, by name."""
+    return {
+        "ping": ping(),
+        "command_small": command(1),
+        "command_large": command(100),
+        "button": button(),
+        "select_small": select(1),
+        "select_large": select(25),
+        "autocomplete_small": autocomplete("lon"),
+        "autocomplete_fuzzy": autocomplete("nrth londn")
+    }
+
+def city_names(count: int) -> List[str]:
+    prefixes = ("North", "South", "East", "West", "New", "Old", "Port", "Lake")
+    roots = ("London", "York", "Haven", "Field", "Bridge", "Stone", "Ford", "Wood")
+    return [
+        f"{prefixes[index % 8]} {roots[(index // 8) % 8]} {index}"
+        for index in range(count)
+    ]
+
+def encode(payload: dict) -> bytes:
+    return json.dumps(payload, separators = (",", ":")).encode()
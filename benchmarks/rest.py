@@ -0,0 +1,106 @@
+"""
+Load-tests the client's Discord REST path against `DiscordStandIn`, the
+local stand-in for the Discord API, so no requests reach discord.com.
+Runs command registration, then concurrent interaction follow-up edits
+and channel messages, and reports throughput, p50/p99 latency, the 429s
+the stand-in sent and the client's rate-limit statistics as JSON.
+
+    python benchmarks/rest.py [--requests N] [--concurrency N] [--latency S] [--bucket-limit N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from typing import Awaitable, Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Import gatepoint from this checkout when run as `python benchmarks/rest.py`.
+sys.path.insert(0, ROOT)
+
+from gatepoint import DiscordStandIn, GatewayClient
+
+def summarise(timings: List[float], elapsed: float) -> dict:
+    timings.sort()
+    return {
+        "requests": len(timings),
+        "per_second": round(len(timings) / elapsed, 1),
+        "p50_ms": round(timings[len(timings) // 2] * 1000, 3),
+        "p99_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000, 3)
+    }
+
+async def load(requests: int, concurrency: int, send: Callable[[int], Awaitable]) -> dict:
+    timings = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(index: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await send(index)
+            timings.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(index) for index in range(requests)))
+    return summarise(timings, time.perf_counter() - started)
+
+async def run(options) -> dict:
+    discord = DiscordStandIn(
+        latency = options.latency,
+        jitter = options.jitter,
+        bucket_limit = options.bucket_limit,
+        bucket_window = options.bucket_window,
+        global_limit = options.global_limit
+    )
+    async with discord:
+        client = GatewayClient(
+            secret_key = "benchmark",
+            public_key = "00" * 32,
+            token = "benchmark",
+            sync_commands = False,
+            identity_cache_path = None,
+            manifest_path = None,
+            api_base = discord.api_base
+        )
+
+        for index in range(50):
+            client.command(f"command{index}", description = "Benchmark command.")(lambda interaction: None)
+
+        bot = await client.fetch_bot()
+        started = time.perf_counter()
+        await client.sync_commands(force = True)
+        sync_ms = (time.perf_counter() - started) * 1000
+
+        async def follow_up(index: int):
+            # Interactions are spread over a few tokens, as concurrent users would be.
+            await client.request("PATCH", f"/webhooks/{bot.id}/token{index % 16}/messages/@original", json = {"content": f"Edit {index}"})
+
+        async def channel_message(index: int):
+            await client.request("POST", f"/channels/{1000 + index % 4}/messages", json = {"content": f"Message {index}"})
+
+        results = {
+            "sync_commands_ms": round(sync_ms, 3),
+            "follow_ups": await load(options.requests, options.concurrency, follow_up),
+            "channel_messages": await load(options.requests, options.concurrency, channel_message),
+            "standin": discord.stats(),
+            "client": client.ratelimiter.stats()
+        }
+        await client.close_session()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type = int, default = 1000, help = "Requests per scenario.")
+    parser.add_argument("--concurrency", type = int, default = 50, help = "Requests in flight at once.")
+    parser.add_argument("--latency", type = float, default = 0.02, help = "Seconds added to every response.")
+    parser.add_argument("--jitter", type = float, default = 0.01, help = "Random seconds added on top of the latency.")
+    parser.add_argument("--bucket-limit", type = int, default = 50, help = "Requests allowed per bucket each window.")
+    parser.add_argument("--bucket-window", type = float, default = 1.0, help = "Seconds until a bucket resets.")
+    parser.add_argument("--global-limit", type = int, default = 500, help = "Requests allowed per second across all buckets.")
+    options = parser.parse_args()
+    print(json.dumps(asyncio.run(run(options)), indent = 4))
+
+if __name__ == "__main__":
+    main()
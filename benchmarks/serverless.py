@@ -0,0 +1,146 @@
+"""
+Simulates serverless invocations of `ServerlessHandler`. Every cold start
+runs in a fresh interpreter that imports gatepoint, builds the client and
+handles one event. Warm invocations reuse one handler in this process.
+Events are signed with a throwaway Ed25519 key, so the full verify,
+dispatch and encode path is measured. No network is used.
+
+    python benchmarks/serverless.py [cold_starts] [warm_invocations]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Import gatepoint from this checkout when run as `python benchmarks/serverless.py`.
+sys.path.insert(0, ROOT)
+
+from nacl.signing import SigningKey
+
+import payloads
+
+def build_handler(public_key: str):
+    from gatepoint import GatewayClient, Reply
+
+    client = GatewayClient(
+        secret_key = "benchmark",
+        public_key = public_key,
+        token = "benchmark",
+        sync_commands = False,
+        identity_cache_path = None,
+        manifest_path = None
+    )
+    pong = Reply("Pong!", ephemeral = True)
+
+    @client.command("ping", description = "Pong!")
+    async def ping(interaction):
+        return pong
+
+    return client.serverless_handler()
+
+def signed_event(signing_key: SigningKey, payload: dict) -> dict:
+    body = json.dumps(payload)
+    signature, timestamp = payloads.sign(signing_key, body.encode())
+    return {
+        "httpMethod": "POST",
+        "headers": {
+            "Content-Type": "application/json",
+            "X-Signature-Ed25519": signature,
+            "X-Signature-Timestamp": timestamp
+        },
+        "body": body,
+        "isBase64Encoded": False
+    }
+
+COMMAND = {
+    "type": 2,
+    "id": "1",
+    "application_id": "1",
+    "token": "benchmark",
+    "data": {
+        "name": "ping"
+    }
+}
+
+def cold_start(seed: str) -> dict:
+    # Runs in the child interpreter.
+    start = time.perf_counter()
+    signing_key = SigningKey(bytes.fromhex(seed))
+    handler = build_handler(signing_key.verify_key.encode().hex())
+    built = time.perf_counter()
+    response = handler(signed_event(signing_key, COMMAND))
+    finished = time.perf_counter()
+    assert response["statusCode"] == 200, response
+    return {
+        "init_ms": (built - start) * 1000,
+        "first_ms": (finished - built) * 1000,
+        "total_ms": (finished - start) * 1000
+    }
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def summarise(values: list) -> dict:
+    return {
+        "p50": round(percentile(values, 0.5), 3),
+        "p99": round(percentile(values, 0.99), 3),
+        "mean": round(statistics.fmean(values), 3)
+    }
+
+def main():
+    if sys.argv[1:2] == ["--cold"]:
+        print(json.dumps(cold_start(sys.argv[2])))
+        return
+
+    cold_starts = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    warm_invocations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    signing_key = SigningKey.generate()
+    seed = bytes(signing_key).hex()
+
+    colds = []
+    for _ in range(cold_starts):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, __file__, "--cold", seed],
+            capture_output = True,
+            text = True,
+            check = True
+        )
+        cold = json.loads(result.stdout)
+        # Includes interpreter start-up and `import gatepoint`, like a real cold start.
+        cold["process_ms"] = (time.perf_counter() - start) * 1000
+        colds.append(cold)
+
+    handler = build_handler(signing_key.verify_key.encode().hex())
+    events = [signed_event(signing_key, COMMAND) for _ in range(warm_invocations)]
+    handler(events[0])
+
+    warm = []
+    for event in events:
+        start = time.perf_counter()
+        handler(event)
+        warm.append((time.perf_counter() - start) * 1000)
+    handler.close()
+
+    print(json.dumps({
+        "cold": {
+            "starts": cold_starts,
+            **{
+                key: summarise([cold[key] for cold in colds])
+                for key in ("process_ms", "init_ms", "first_ms", "total_ms")
+            }
+        },
+        "warm": {
+            "invocations": warm_invocations,
+            "ms": summarise(warm),
+            "per_second": round(1000 / statistics.fmean(warm), 1)
+        }
+    }, indent = 4))
+
+if __name__ == "__main__":
+    main()
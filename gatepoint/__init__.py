@@ -18,13 +18,53 @@ __version__ = '0.3'
 __path__ = __import__('pkgutil').extend_path(__path__, __name__)
 
 import logging
+from importlib import import_module
 from typing import NamedTuple, Literal
 
-from .gateway import GatewayClient
-from .interaction import Interaction, CommandInteraction, ButtonInteraction
-from .option import Choice, CommandOption, MenuOption
-from .objects import (OptionType, Emoji, User, Member, Role, Channel, Attachment, Embed)
-from .components import *
+# Public names and the modules they're imported from on first access, so
+# building components or embeds never pays for the server and HTTP stack.
+_LAZY = {
+    "GatewayClient": ".gateway",
+    "InteractionApp": ".asgi",
+    "ServerlessHandler": ".serverless",
+    "DiscordStandIn": ".standin",
+    "ChoiceIndex": ".autocomplete",
+    "Reply": ".responses",
+    "Interaction": ".interaction",
+    "CommandInteraction": ".interaction",
+    "ButtonInteraction": ".interaction",
+    "Choice": ".option",
+    "CommandOption": ".option",
+    "MenuOption": ".option",
+    "OptionType": ".objects",
+    "Emoji": ".objects",
+    "User": ".objects",
+    "Member": ".objects",
+    "Role": ".objects",
+    "Channel": ".objects",
+    "Attachment": ".objects",
+    "Embed": ".objects",
+    "Button": ".components",
+    "SelectMenu": ".components",
+    "UserSelect": ".components",
+    "RoleSelect": ".components",
+    "MentionableSelect": ".components",
+    "ChannelSelect": ".components",
+    "ActionRow": ".components"
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 class VersionInfo(NamedTuple):
     major: int
@@ -0,0 +1,86 @@
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .gateway import GatewayClient
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+
+class InteractionApp:
+    def __init__(self, client: "GatewayClient", path: Optional[str] = None):
+        """## Interaction App
+        A minimal ASGI application serving a client's interactions without
+        any framework routing. Mount it under any ASGI server, or inside an
+        existing application.
+
+        Args:
+            `client` (`GatewayClient`): The client whose interactions are served.
+            `path` (`Optional[str]`): Only accept interactions on this path. Defaults to any path.
+
+        ## Example::
+
+            app = InteractionAPI.asgi_app()
+            # uvicorn module:app
+        """
+        self.client = client
+        self.path = path
+
+    async def __call__(self, scope: dict, receive, send):
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+
+        if scope["type"] != "http":
+            return
+
+        if self.path is not None and scope["path"] != self.path:
+            return await self.respond(send, 404, b'{"detail":"Not Found"}')
+
+        if scope["method"] == "GET":
+            return await self.respond(send, 200, b'"This is a Discord Interaction API."')
+
+        if scope["method"] != "POST":
+            return await self.respond(send, 405, b'{"detail":"Method Not Allowed"}')
+
+        signature = timestamp = None
+        for name, value in scope["headers"]:
+            if name == b"x-signature-ed25519":
+                signature = value.decode("latin-1")
+
+            elif name == b"x-signature-timestamp":
+                timestamp = value.decode("latin-1")
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        status, content = await self.client.process(signature, timestamp, body)
+        await self.respond(send, status, content)
+
+    async def respond(self, send, status: int, body: bytes):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": JSON_HEADERS + [(b"content-length", str(len(body)).encode())]
+        })
+        await send({
+            "type": "http.response.body",
+            "body": body
+        })
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.client.startup()
+                except Exception as error:
+                    await send({"type": "lifespan.startup.failed", "message": str(error)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+
+            elif message["type"] == "lifespan.shutdown":
+                await self.client.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
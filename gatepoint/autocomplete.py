@@ -0,0 +1,287 @@
+import heapq
+import time
+
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .option import Choice
+
+# Discord rejects autocomplete responses with more than 25 choices.
+MAX_CHOICES = 25
+MAX_NAME_LENGTH = 100
+
+def to_choice(choice: Union[Choice, str, tuple, dict]) -> dict:
+    if isinstance(choice, Choice):
+        choice = choice.to_dict()
+
+    elif isinstance(choice, str):
+        choice = {"name": choice, "value": choice}
+
+    elif isinstance(choice, tuple):
+        choice = {"name": choice[0], "value": choice[1]}
+
+    if len(choice["name"]) > MAX_NAME_LENGTH:
+        choice = {"name": choice["name"][:MAX_NAME_LENGTH], "value": choice["value"]}
+    return choice
+
+def trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class ChoiceIndex:
+    def __init__(self, choices: Iterable[Union[Choice, str, tuple, dict]], max_postings: int = 2048):
+        """## Choice Index
+        In-memory search index over a large set of autocomplete choices.
+        Prefix matches on the start of any word come first, then fuzzy
+        matches ranked by trigram similarity fill the remaining slots.
+
+        The prefix index is a flattened trie: every word suffix of every
+        choice kept in one sorted array, so a prefix's subtree is a single
+        contiguous slice found with two binary searches.
+
+        Args:
+            `choices` (`Iterable`): `Choice`s, strings, `(name, value)` tuples or choice dicts.
+            `max_postings` (`int`): Index entries read per fuzzy query. Defaults to `2048`.
+
+        ## Example::
+
+            cities = ChoiceIndex(load_cities())
+
+            @InteractionAPI.autocompleter("weather", "city")
+            async def city(interaction, value):
+                return cities
+        """
+        self.choices: List[dict] = [to_choice(choice) for choice in choices]
+        self.max_postings = max_postings
+
+        keys = []
+        self.grams: Dict[str, List[int]] = {}
+        self.gram_counts: List[int] = []
+        for index, choice in enumerate(self.choices):
+            name = choice["name"].casefold()
+            start = 0
+            for word in name.split():
+                start = name.index(word, start)
+                keys.append((name[start:], index))
+                start += len(word)
+
+            grams = trigrams(name)
+            self.gram_counts.append(len(grams))
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(index)
+
+        keys.sort()
+        self.keys: List[str] = [key for key, _ in keys]
+        self.positions: List[int] = [index for _, index in keys]
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def prefix(self, query: str, limit: int = MAX_CHOICES) -> List[int]:
+        """## ChoiceIndex.prefix
+        Returns the indices of choices with a word starting with `query`.
+
+        Args:
+            `query` (`str`): Case-insensitive prefix.
+            `limit` (`int`): Maximum number of results. Defaults to `25`.
+
+        Returns:
+            `List[int]`: Indices into `choices`, in alphabetical order of the matched word.
+        """
+        query = query.casefold()
+        start = bisect_left(self.keys, query)
+        end = bisect_left(self.keys, query + "\U0010ffff", start)
+        found = {}
+        for position in range(start, end):
+            found.setdefault(self.positions[position])
+            if len(found) == limit:
+                break
+        return list(found)
+
+    def fuzzy(self, query: str, limit: int = MAX_CHOICES) -> List[int]:
+        """## ChoiceIndex.fuzzy
+        Returns the indices of the choices most similar to `query`.
+
+        Candidates are gathered from the query's rarest trigrams, reading at
+        most `max_postings` index entries, and only the best `limit * 4` are
+        scored. Trigrams shared by much of the set barely narrow the search,
+        so this keeps queries fast at the cost of missing some equally close
+        matches when every trigram of the query is common.
+
+        Args:
+            `query` (`str`): Case-insensitive search text.
+            `limit` (`int`): Maximum number of results. Defaults to `25`.
+
+        Returns:
+            `List[int]`: Indices into `choices`, most similar first.
+        """
+        grams = trigrams(query.casefold())
+        shared = Counter()
+        budget = self.max_postings
+        for postings in sorted((self.grams[gram] for gram in grams if gram in self.grams), key = len):
+            if shared and len(postings) > budget:
+                break
+
+            shared.update(postings[:budget])
+            budget -= len(postings)
+
+        size = len(grams)
+
+        def similarity(index: int) -> float:
+            common = len(grams & trigrams(self.choices[index]["name"].casefold()))
+            return common / (size + self.gram_counts[index] - common)
+
+        shortlist = heapq.nlargest(limit * 4, shared, key = shared.__getitem__)
+        return heapq.nlargest(limit, shortlist, key = similarity)
+
+    def search(self, query: str, limit: int = MAX_CHOICES) -> List[dict]:
+        """## ChoiceIndex.search
+        Returns the best choices for what the user has typed so far.
+
+        Args:
+            `query` (`str`): The focused option's current value.
+            `limit` (`int`): Maximum number of results. Defaults to `25`.
+
+        Returns:
+            `List[dict]`: Choice payloads.
+        """
+        query = query.strip()
+        if not query:
+            return self.choices[:limit]
+
+        found = dict.fromkeys(self.prefix(query, limit))
+        if len(found) < limit:
+            for index in self.fuzzy(query, limit):
+                found.setdefault(index)
+                if len(found) == limit:
+                    break
+        return [self.choices[index] for index in found]
+
+class TTLCache:
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 30.0):
+        """## TTL Cache
+        Least recently used cache whose entries also expire after `ttl` seconds.
+
+        Args:
+            `maxsize` (`int`): Maximum number of entries. Defaults to `4096`.
+            `ttl` (`Optional[float]`): Seconds an entry stays valid, `None` to never expire. Defaults to `30.0`.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or (self.ttl is not None and entry[0] < time.monotonic()):
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last = False)
+
+    def clear(self):
+        self._entries.clear()
+
+class Autocompleter:
+    def __init__(self, command: str, option: str, func: Callable, cache: Optional[TTLCache] = None):
+        """## Autocompleter
+        Answers autocomplete interactions for one command option, caching the
+        choices for each `(command, option, value)` and enforcing Discord's limits.
+        The handler may return `Choice`s, strings, `(name, value)` tuples, choice
+        dicts, or a `ChoiceIndex` to search.
+
+        Args:
+            `command` (`str`): Name of the command.
+            `option` (`str`): Name of the option.
+            `func` (`Callable`): Coroutine function taking the interaction and the focused value.
+            `cache` (`Optional[TTLCache]`): Cache shared between autocompleters, `None` to disable. Defaults to `None`.
+        """
+        self.command = command
+        self.option = option
+        self.func = func
+        self.cache = cache
+
+    async def complete(self, interaction, value: str) -> List[dict]:
+        key = (self.command, self.option, value)
+        if self.cache is not None:
+            choices = self.cache.get(key)
+            if choices is not None:
+                return choices
+
+        result = await self.func(interaction, value)
+        if isinstance(result, ChoiceIndex):
+            choices = result.search(str(value))
+
+        else:
+            choices = [to_choice(choice) for choice in list(result or [])[:MAX_CHOICES]]
+
+        if self.cache is not None:
+            self.cache.set(key, choices)
+        return choices
+
+class AutocompleteRoute:
+    def __init__(self, completers: Dict[str, Autocompleter]):
+        """## Autocomplete Route
+        Dispatches a command's autocomplete interactions to the autocompleter
+        of the focused option.
+
+        Args:
+            `completers` (`Dict[str, Autocompleter]`): Autocompleters keyed by option name.
+        """
+        self.completers = completers
+
+    async def __call__(self, interaction, option: Optional[str], value: Any) -> dict:
+        completer = self.completers.get(option)
+        choices = await completer.complete(interaction, value) if completer else []
+        return {
+            "type": 8,
+            "data": {
+                "choices": choices
+            }
+        }
+
+def focused_option(options: Optional[list]) -> Tuple[Optional[str], Any]:
+    """## Focused Option
+    Finds the option the user is typing in, looking inside subcommands.
+
+    Args:
+        `options` (`Optional[list]`): The interaction's `data.options`.
+
+    Returns:
+        `Tuple[Optional[str], Any]`: The focused option's name and current value.
+    """
+    for option in options or ():
+        if option.get("focused"):
+            return option["name"], option.get("value", "")
+
+        if option.get("options"):
+            name, value = focused_option(option["options"])
+            if name is not None:
+                return name, value
+    return None, ""
+
+def mark_autocomplete(options: Optional[list], names: set):
+    """## Mark Autocomplete
+    Flags the registration payloads of options that have an autocompleter.
+
+    Args:
+        `options` (`Optional[list]`): Option payloads of a command, modified in place.
+        `names` (`set`): Names of the options with an autocompleter.
+    """
+    for option in options or ():
+        if option.get("type") in (1, 2):
+            mark_autocomplete(option.get("options"), names)
+
+        elif option["name"] in names:
+            option["autocomplete"] = True
@@ -0,0 +1,111 @@
+import inspect
+
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+from .objects import User, OptionType
+
+if TYPE_CHECKING:
+    from .interaction import Interaction
+
+def resolve_user(resolved, value: str, annotation: Any):
+    # Guild interactions resolve the member too, unless the handler asked for a plain user.
+    if annotation is not User and value in resolved.members:
+        return resolved.members[value]
+    return resolved.users.get(value)
+
+def resolve_channel(resolved, value: str, annotation: Any):
+    return resolved.channels.get(value)
+
+def resolve_role(resolved, value: str, annotation: Any):
+    return resolved.roles.get(value)
+
+def resolve_mentionable(resolved, value: str, annotation: Any):
+    if value in resolved.roles:
+        return resolved.roles[value]
+    return resolve_user(resolved, value, annotation)
+
+def resolve_attachment(resolved, value: str, annotation: Any):
+    return resolved.attachments.get(value)
+
+CONVERTERS: Dict[int, Callable[[Any], Any]] = {
+    OptionType.STRING: str,
+    OptionType.INTEGER: int,
+    OptionType.BOOLEAN: bool,
+    OptionType.NUMBER: float
+}
+
+RESOLVERS: Dict[int, Callable[[Any, str, Any], Any]] = {
+    OptionType.USER: resolve_user,
+    OptionType.CHANNEL: resolve_channel,
+    OptionType.ROLE: resolve_role,
+    OptionType.MENTIONABLE: resolve_mentionable,
+    OptionType.ATTACHMENT: resolve_attachment
+}
+
+class Binder:
+    __slots__ = ("func", "defaults", "annotations", "accepts_any")
+
+    def __init__(self, func: Callable):
+        """## Binder
+        Binds a command's options to its handler's keyword arguments by name.
+        The handler's signature is inspected once here; binding an interaction
+        only walks its options.
+
+        Values are converted by their `OptionType`, and user, member, role,
+        channel and attachment options are resolved into `User`, `Member`,
+        `Role`, `Channel` and `Attachment` objects. Options the user left out
+        take the parameter's default, or `None` if it has none. Dashes in option
+        names become underscores, so `user-id` binds to `user_id`. Options that
+        aren't parameters are dropped unless the handler takes `**kwargs`.
+
+        Args:
+            `func` (`Callable`): The handler, taking the interaction first.
+
+        ## Example::
+
+            @InteractionAPI.add_option(OptionType.USER, "member", "Who to ban.", required = True)
+            @InteractionAPI.add_option(OptionType.INTEGER, "days", "Days of messages to delete.")
+            @InteractionAPI.command("ban")
+            async def ban(interaction, member: Member, days: int = 0):
+                ...
+        """
+        self.func = func
+        self.defaults: Dict[str, Any] = {}
+        self.annotations: Dict[str, Any] = {}
+        self.accepts_any = False
+
+        parameters = list(inspect.signature(func).parameters.values())[1:]
+        for parameter in parameters:
+            if parameter.kind is parameter.VAR_KEYWORD:
+                self.accepts_any = True
+
+            elif parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY):
+                self.defaults[parameter.name] = None if parameter.default is parameter.empty else parameter.default
+                self.annotations[parameter.name] = parameter.annotation
+
+    def __call__(self, interaction: "Interaction", options: list) -> Dict[str, Any]:
+        """## Binder.__call__
+        Builds the handler's keyword arguments.
+
+        Args:
+            `interaction` (`Interaction`): The interaction being handled.
+            `options` (`list`): Option payloads of the command or subcommand used.
+
+        Returns:
+            `Dict[str, Any]`: Keyword arguments for the handler.
+        """
+        arguments = self.defaults.copy()
+        for option in options:
+            name = option["name"].replace("-", "_")
+            if name not in arguments and not self.accepts_any:
+                continue
+
+            value = option.get("value")
+            type_ = option.get("type")
+            if type_ in RESOLVERS:
+                value = RESOLVERS[type_](interaction.resolved, value, self.annotations.get(name))
+
+            elif type_ in CONVERTERS and value is not None:
+                value = CONVERTERS[type_](value)
+            arguments[name] = value
+        return arguments
@@ -1,5 +1,9 @@
-from .interactions import (CommandInteraction, SubCommandInteraction,
-    SubCommandGroupInteraction, MenuInteraction, ButtonInteraction)
+from typing import Callable, List, Optional, Union
+
+from ..interaction import (CommandInteraction, SubCommandInteraction,
+    SubCommandGroupInteraction, MenuInteraction, ButtonInteraction, Snowflake)
+from ..objects import OptionType
+from ..option import CommandOption
 
 class Chunk:
     def __init__(self):
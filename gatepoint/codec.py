@@ -0,0 +1,77 @@
+import json
+
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+def _default(obj: Any) -> Any:
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class JSONCodec:
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        loads: Optional[Callable[[bytes], Any]] = None,
+        dumps: Optional[Callable[[Any], bytes]] = None
+    ):
+        """## JSON Codec
+        Decodes interaction payloads and encodes responses.
+        Picks the fastest installed backend unless one is given.
+
+        Args:
+            `backend` (`Optional[str]`): `"orjson"`, `"ujson"` or `"json"`. Defaults to the fastest installed.
+            `loads` (`Optional[Callable]`): Custom decoder taking `bytes`, overrides `backend`. Defaults to `None`.
+            `dumps` (`Optional[Callable]`): Custom encoder returning `bytes`, overrides `backend`. Defaults to `None`.
+
+        Raises:
+            ValueError: Unknown or uninstalled backend provided.
+        """
+        if loads or dumps:
+            if not (loads and dumps):
+                raise ValueError("Both loads and dumps must be provided for a custom backend.")
+
+            self.name = "custom"
+            self.loads = loads
+            self.dumps = dumps
+            return
+
+        if backend is None:
+            backend = "orjson" if orjson else "ujson" if ujson else "json"
+
+        if backend == "orjson" and orjson:
+            self.loads = orjson.loads
+            self.dumps = self._orjson_dumps
+
+        elif backend == "ujson" and ujson:
+            self.loads = ujson.loads
+            self.dumps = self._ujson_dumps
+
+        elif backend == "json":
+            self.loads = json.loads
+            self.dumps = self._json_dumps
+
+        else:
+            raise ValueError(f"JSON backend {backend!r} is not available.")
+        self.name = backend
+
+    @staticmethod
+    def _orjson_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default = _default)
+
+    @staticmethod
+    def _ujson_dumps(obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii = False, default = _default).encode()
+
+    @staticmethod
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators = (",", ":"), ensure_ascii = False, default = _default).encode()
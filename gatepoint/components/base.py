@@ -0,0 +1,29 @@
+from typing import Any
+
+class Component:
+    """## Component
+    Base class for message components. A component's payload is built by
+    its first `to_dict` call and reused after that, and the component is
+    frozen so the cached payload can't go stale. Build a new component
+    instead of changing one that has been sent.
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        build = cls.__dict__.get("to_dict")
+        if build is None:
+            return
+
+        def to_dict(self) -> dict:
+            payload = self.__dict__.get("_payload")
+            if payload is None:
+                payload = build(self)
+                object.__setattr__(self, "_payload", payload)
+            return payload
+
+        to_dict.__doc__ = build.__doc__
+        cls.to_dict = to_dict
+
+    def __setattr__(self, name: str, value: Any):
+        if "_payload" in self.__dict__:
+            raise AttributeError(f"{type(self).__name__} can't be changed after it has been sent.")
+        object.__setattr__(self, name, value)
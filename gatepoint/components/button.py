@@ -1,6 +1,8 @@
 from typing import Union
 
-class Button:
+from .base import Component
+
+class Button(Component):
 	def __init__(
 		self,
 		label: str,
@@ -15,3 +17,19 @@ class Button:
 		self.custom_id = custom_id
 		self.style = 5 if url else style or 1
 		self.url = url
+
+	def to_dict(self) -> dict:
+		dict_ = {
+			"type": 2,
+			"style": self.style,
+			"label": self.label
+		}
+
+		# Link buttons open their URL and don't send an interaction.
+		if self.url:
+			dict_["url"] = self.url
+
+		else:
+			dict_["custom_id"] = self.custom_id
+
+		return dict_
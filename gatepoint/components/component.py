@@ -1,9 +1,10 @@
 from typing import Union, List
 
+from .base import Component
 from .button import Button
 from .menu import SelectMenu, UserSelect, RoleSelect, MentionableSelect, ChannelSelect
 
-class ActionRow:
+class ActionRow(Component):
     def __init__(self, *components: Union[Button, SelectMenu, UserSelect, RoleSelect, MentionableSelect, ChannelSelect]):
         self.components = components
         if len(self.components) > 5:
@@ -1,8 +1,9 @@
 from typing import List
 
 from ..option import Choice
+from .base import Component
 
-class SelectMenu:
+class SelectMenu(Component):
     def __init__(
         self,
         custom_id: str,
@@ -13,7 +14,7 @@ class SelectMenu:
         disabled: bool = False
     ):
         self.custom_id = custom_id
-        self.options = options
+        self.options = tuple(options)
         self.placeholder = placeholder
         self.min_values = min_values
         self.max_values = max_values
@@ -43,7 +44,7 @@ class SelectMenu:
 
         return dict_
 
-class UserSelect:
+class UserSelect(Component):
     def __init__(
         self,
         custom_id: str,
@@ -78,7 +79,7 @@ class UserSelect:
 
         return dict_
 
-class RoleSelect:
+class RoleSelect(Component):
     def __init__(self, custom_id: str, placeholder: str = None, min_values: int = 1, max_values: int = 1, disabled: bool = False):
         self.custom_id = custom_id
         self.placeholder = placeholder
@@ -96,7 +97,7 @@ class RoleSelect:
             "disabled": self.disabled
         }
 
-class MentionableSelect:
+class MentionableSelect(Component):
     def __init__(self, custom_id: str, placeholder: str = None, min_values: int = 1, max_values: int = 1, disabled: bool = False):
         self.custom_id = custom_id
         self.placeholder = placeholder
@@ -114,7 +115,7 @@ class MentionableSelect:
             "disabled": self.disabled
         }
 
-class ChannelSelect:
+class ChannelSelect(Component):
     def __init__(self, custom_id: str, placeholder: str = None, min_values: int = 1, max_values: int = 1, disabled: bool = False):
         self.custom_id = custom_id
         self.placeholder = placeholder
@@ -0,0 +1,291 @@
+import asyncio
+import time
+
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple, Union
+
+from .interaction import Interaction
+from .autocomplete import AutocompleteRoute, focused_option
+from .binding import Binder
+from .routing import CustomIdRouter
+
+if TYPE_CHECKING:
+    from .gateway import GatewayClient
+
+# Component types that are select menus rather than buttons.
+MENU_COMPONENTS = frozenset((3, 5, 6, 7, 8))
+
+KIND_EVENTS = {
+    "command": "command_receive",
+    "button": "button_click",
+    "menu": "menu_select",
+    "autocomplete": "autocomplete",
+    "modal": "modal_submit"
+}
+
+def unregistered(name: str) -> dict:
+    return {
+        "type": 4,
+        "data": {
+            "content": f"This {name} is not registered with Interaction Gateway API.",
+            "flags": 64
+        }
+    }
+
+# Responses that never change, encoded once per dispatcher with the client's codec.
+PONG = {
+    "type": 1
+}
+
+FALLBACKS = {
+    "command": unregistered("command"),
+    "button": unregistered("button"),
+    "menu": unregistered("menu"),
+    "modal": unregistered("modal"),
+    "autocomplete": {
+        "type": 8,
+        "data": {
+            "choices": []
+        }
+    }
+}
+
+UNSUPPORTED = {
+    "type": 4,
+    "data": {
+        "content": "This interaction is not yet supported by Interaction Gateway API.",
+        "flags": 64
+    }
+}
+
+def command_path(data: dict) -> Tuple[str, list]:
+    """## Command Path
+    Walks `data.options` down through any subcommand group and subcommand.
+
+    Args:
+        `data` (`dict`): The interaction's `data`.
+
+    Returns:
+        `Tuple[str, list]`: The path of the handler, e.g. `"mod user ban"`, and the leaf options.
+    """
+    path = data.get("name")
+    options = data.get("options") or ()
+    # Discord sends a subcommand group or subcommand as the only option of its parent.
+    while options and options[0].get("type") in (1, 2):
+        path = f"{path} {options[0]['name']}"
+        options = options[0].get("options") or ()
+    return path, options
+
+def no_arguments(interaction_payload: dict, options: list) -> tuple:
+    return ()
+
+def menu_arguments(interaction_payload: dict, options: list) -> tuple:
+    return (interaction_payload["data"].get("values") or [],)
+
+def autocomplete_arguments(interaction_payload: dict, options: list) -> tuple:
+    return focused_option(options)
+
+def modal_arguments(interaction_payload: dict, options: list) -> tuple:
+    return ({
+        component["custom_id"]: component.get("value")
+        for row in interaction_payload["data"].get("components") or ()
+        for component in row.get("components") or ()
+    },)
+
+def metric_labels(kind: str, name: str) -> tuple:
+    return (("type", kind), ("name", name))
+
+class Route:
+    __slots__ = ("handler", "inline", "concurrent", "background", "arguments", "binder", "labels")
+
+    def __init__(
+        self,
+        handler: Callable,
+        listeners: tuple,
+        arguments: Callable[[dict, list], tuple],
+        binder: Optional[Binder] = None,
+        labels: tuple = ()
+    ):
+        """## Route
+        A handler prepared for dispatch, along with the listeners fired with it
+        split by how they're run.
+
+        Args:
+            `handler` (`Callable`): The interaction handler.
+            `listeners` (`tuple`): Listeners fired for the handler.
+            `arguments` (`Callable`): Builds the handler's extra arguments from the payload and its leaf options.
+            `binder` (`Optional[Binder]`): Builds the handler's keyword arguments from the options. Defaults to `None`.
+            `labels` (`tuple`): Metric labels of the route. Defaults to none.
+        """
+        self.handler = handler
+        self.inline = tuple(listener for listener in listeners if getattr(listener, "mode", "inline") == "inline")
+        self.concurrent = tuple(listener for listener in listeners if getattr(listener, "mode", None) == "concurrent")
+        self.background = tuple(listener for listener in listeners if getattr(listener, "mode", None) == "background")
+        self.arguments = arguments
+        self.binder = binder
+        self.labels = labels
+
+class Dispatcher:
+    def __init__(self, client: "GatewayClient"):
+        """## Dispatcher
+        Dispatch table compiled once from a client's registered handlers and
+        listeners, mapping `(kind, key)` straight to a prepared `Route`.
+        Subcommands are keyed by their full path, so the subcommand tree
+        flattens into the same table.
+        Buttons and menus registered with a `custom_id` template are matched
+        by a `CustomIdRouter` when no exact `custom_id` is registered.
+
+        Args:
+            `client` (`GatewayClient`): The client to compile handlers from.
+        """
+        self.client = client
+        dumps = client.codec.dumps
+        self.pong = dumps(PONG)
+        self.fallbacks = {kind: dumps(payload) for kind, payload in FALLBACKS.items()}
+        self.unsupported = dumps(UNSUPPORTED)
+
+        self.routes: Dict[Tuple[str, str], Route] = {}
+        self.routers: Dict[str, CustomIdRouter] = {}
+        self.compile()
+
+    def compile(self):
+        """## Dispatcher.compile
+        Rebuilds the dispatch table from the client's handlers and listeners.
+        """
+        client = self.client
+        received = tuple(client.events.get("interaction_receive") or ())
+        listeners = {
+            kind: received + tuple(client.events.get(event) or ())
+            for kind, event in KIND_EVENTS.items()
+        }
+
+        routes = {}
+        for name, handler in {**client.commands, **client.subcommands}.items():
+            routes[("command", name)] = Route(handler, listeners["command"], no_arguments, Binder(handler), metric_labels("command", name))
+
+        for custom_id, handler in client.buttons.items():
+            routes[("button", custom_id)] = Route(handler, listeners["button"], no_arguments, labels = metric_labels("button", custom_id))
+
+        for custom_id, handler in client.menus.items():
+            routes[("menu", custom_id)] = Route(handler, listeners["menu"], menu_arguments, labels = metric_labels("menu", custom_id))
+
+        routers = {
+            "button": CustomIdRouter(),
+            "menu": CustomIdRouter()
+        }
+        for template, handler in client.button_templates.items():
+            # Labelled by template, not by each `custom_id` it matches.
+            routers["button"].add(template, Route(handler, listeners["button"], no_arguments, labels = metric_labels("button", template)))
+
+        for template, handler in client.menu_templates.items():
+            routers["menu"].add(template, Route(handler, listeners["menu"], menu_arguments, labels = metric_labels("menu", template)))
+        self.routers = routers
+
+        completers = {}
+        for (command, option), completer in client.autocomplete.items():
+            completers.setdefault(command, {})[option] = completer
+
+        for command, options in completers.items():
+            routes[("autocomplete", command)] = Route(
+                AutocompleteRoute(options),
+                listeners["autocomplete"],
+                autocomplete_arguments,
+                labels = metric_labels("autocomplete", command)
+            )
+
+        for custom_id, handler in client.modals.items():
+            routes[("modal", custom_id)] = Route(handler, listeners["modal"], modal_arguments, labels = metric_labels("modal", custom_id))
+        self.routes = routes
+
+    @staticmethod
+    def resolve(interaction_payload: dict) -> Optional[Tuple[str, str, list]]:
+        """## Dispatcher.resolve
+        Returns the dispatch table key of an interaction payload, along with
+        the options of the subcommand or command that was used.
+
+        Args:
+            `interaction_payload` (`dict`): Parsed interaction sent from Discord.
+
+        Returns:
+            `Optional[Tuple[str, str, list]]`: The `(kind, key, options)` of the payload, `None` if unsupported.
+        """
+        type_ = interaction_payload["type"]
+        data = interaction_payload.get("data") or {}
+        if type_ == 2:
+            return ("command", *command_path(data))
+
+        elif type_ == 3:
+            kind = "menu" if data.get("component_type") in MENU_COMPONENTS else "button"
+            return kind, data.get("custom_id"), ()
+
+        elif type_ == 4:
+            # Autocompleters are registered per command, not per subcommand.
+            return "autocomplete", data.get("name"), command_path(data)[1]
+
+        elif type_ == 5:
+            return "modal", data.get("custom_id"), ()
+        return None
+
+    async def dispatch(self, interaction_payload: dict) -> Union[dict, bytes]:
+        """## Dispatcher.dispatch
+        Runs the listeners and handler for an interaction payload.
+
+        Args:
+            `interaction_payload` (`dict`): Parsed interaction sent from Discord.
+
+        Raises:
+            ValueError: Interaction type not recognised.
+
+        Returns:
+            `Union[dict, bytes]`: Payload to send to Discord, or its pre-encoded body.
+        """
+        if interaction_payload["type"] == 1:
+            return self.pong
+
+        resolved = self.resolve(interaction_payload)
+        if resolved is None:
+            if 1 <= interaction_payload["type"] < 12:
+                return self.unsupported
+            raise ValueError("Interaction not recognised by Interaction Gateway API.")
+
+        kind, key, options = resolved
+        metrics = self.client.metrics
+        route = self.routes.get((kind, key))
+        parameters = {}
+        if route is None:
+            router = self.routers.get(kind)
+            match = router.match(key) if router is not None and key is not None else None
+            if match is None:
+                if metrics is not None:
+                    metrics.inc("gatepoint_unregistered_total", (("type", kind),))
+                return self.fallbacks[kind]
+            route, parameters = match
+
+        start = time.perf_counter()
+        try:
+            interaction = Interaction(interaction_payload, self.client)
+            if route.binder is not None:
+                parameters = route.binder(interaction, options)
+
+            for listener in route.inline:
+                await listener(interaction)
+
+            for listener in route.background:
+                await self.client.listener_queue.put(listener.func, interaction)
+
+            if route.concurrent:
+                response, *_ = await asyncio.gather(
+                    route.handler(interaction, *route.arguments(interaction_payload, options), **parameters),
+                    *(listener.isolated(interaction) for listener in route.concurrent)
+                )
+                return response
+            return await route.handler(interaction, *route.arguments(interaction_payload, options), **parameters)
+
+        except Exception:
+            if metrics is not None:
+                metrics.inc("gatepoint_interaction_errors_total", route.labels)
+            raise
+
+        finally:
+            if metrics is not None:
+                metrics.inc("gatepoint_interactions_total", route.labels)
+                metrics.observe("gatepoint_interaction_duration_seconds", route.labels, time.perf_counter() - start)
@@ -1,28 +1,37 @@
-import uvicorn
-import aiohttp
-import requests
+from concurrent.futures import ThreadPoolExecutor
 
-from .interaction import (Interaction,
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+from .interaction import (Interaction, Snowflake,
     CommandInteraction, ButtonInteraction, MenuInteraction,
     SubCommandInteraction, SubCommandGroupInteraction)
 from .chunks.chunk import Chunk
+from .utils import output
+from .ratelimit import RateLimiter, route_key
+from .verification import Verifier
+from .codec import JSONCodec
+from .asgi import InteractionApp
+from .serverless import ServerlessHandler
+from .dispatch import Dispatcher
+from .listeners import Listener
+from .tasks import TaskQueue
+from .responses import Reply, use_codec
+from .metrics import Metrics
+from .autocomplete import Autocompleter, TTLCache, mark_autocomplete
+from .routing import PARAMETER, CustomIdTemplate
 from .option import CommandOption
+from .objects import OptionType
 
-from nacl.signing import VerifyKey
-from nacl.exceptions import BadSignatureError
-
-from fastapi import FastAPI, Request, HTTPException
-
-from typing import Callable, Any, List, Optional
-
-def output(content, type_ = None):
-    if type_ == "ERROR":
-        return print(f"ERR: {content}")
+from typing import TYPE_CHECKING, Callable, Any, Dict, List, Optional, Set, Tuple, Union
 
-    elif type_ == "WARNING":
-        return print(f"WARN: {content}")
-
-    return print(f"INFO: {content}")
+# The HTTP client and server are only imported once they are needed, keeping
+# `import gatepoint` light for serverless cold starts.
+if TYPE_CHECKING:
+    import aiohttp
 
 class Bot:
     def __init__(self, json: dict):
@@ -31,6 +40,14 @@ class Bot:
         setattr(self, "username", json["username"])
         setattr(self, "discriminator", json["discriminator"])
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "avatar": self.avatar,
+            "username": self.username,
+            "discriminator": self.discriminator
+        }
+
 class GatewayClient:
     def __init__(
         self,
@@ -39,7 +56,30 @@ class GatewayClient:
         token: str,
         api_version: Optional[int] = 10,
         port: Optional[int] = 80,
-        verbose: Optional[bool] = False
+        verbose: Optional[bool] = False,
+        connection_limit: Optional[int] = 100,
+        keepalive_timeout: Optional[float] = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        max_retries: Optional[int] = 3,
+        sync_commands: Optional[bool] = True,
+        manifest_path: Optional[str] = ".gatepoint_commands.json",
+        identity_cache_path: Optional[str] = ".gatepoint_identity.json",
+        identity_cache_ttl: Optional[float] = 3600,
+        timestamp_window: Optional[float] = 300,
+        verify_workers: Optional[int] = None,
+        json_backend: Optional[str] = None,
+        defer_after: Optional[float] = 2.5,
+        defer_ephemeral: Optional[bool] = False,
+        listener_workers: Optional[int] = 4,
+        listener_queue_size: Optional[int] = 1000,
+        listener_overflow: Optional[str] = "drop_oldest",
+        task_workers: Optional[int] = 8,
+        task_queue_size: Optional[int] = 1000,
+        drain_timeout: Optional[float] = 10.0,
+        autocomplete_cache_size: Optional[int] = 4096,
+        autocomplete_cache_ttl: Optional[float] = 30.0,
+        api_base: Optional[str] = "https://discord.com/api",
+        metrics: Optional[bool] = True
     ):
         """## GatewayClient
         The main class for building your Interaction API for Discord.
@@ -51,41 +91,208 @@ class GatewayClient:
             `api_version` (`Optional[int]`): The API version your requests will go through. Defaults to `10`.
             `port` (`Optional[int]`): The port your API will be hosted in. Defaults to `80`.
             `verbose` (`Optional[bool]`): Enable to see errors or requests from discord. Defaults to `False`.
+            `connection_limit` (`Optional[int]`): Maximum number of pooled connections to the Discord API. Defaults to `100`.
+            `keepalive_timeout` (`Optional[float]`): Seconds an idle pooled connection is kept open. Defaults to `30.0`.
+            `dns_cache_ttl` (`Optional[int]`): Seconds resolved Discord API addresses are cached. Defaults to `300`.
+            `max_retries` (`Optional[int]`): How many times a rate limited request is retried. Defaults to `3`.
+            `sync_commands` (`Optional[bool]`): Sync registered commands with Discord on startup. Defaults to `True`.
+            `manifest_path` (`Optional[str]`): File storing hashes of the last synced commands, `None` to always sync. Defaults to `".gatepoint_commands.json"`.
+            `identity_cache_path` (`Optional[str]`): File caching the bot's identity between restarts, `None` to disable. Defaults to `".gatepoint_identity.json"`.
+            `identity_cache_ttl` (`Optional[float]`): Seconds the cached identity stays valid. Defaults to `3600`.
+            `timestamp_window` (`Optional[float]`): Seconds a request's signature timestamp may be skewed by before it's rejected. Defaults to `300`.
+            `verify_workers` (`Optional[int]`): Threads to offload signature verification to, `None` to verify inline. Defaults to `None`.
+            `json_backend` (`Optional[str]`): JSON library used for payloads, `"orjson"`, `"ujson"` or `"json"`. Defaults to the fastest installed.
+            `defer_after` (`Optional[float]`): Seconds a handler may run before the interaction is deferred and its result sent as an edit, `None` to never defer. Defaults to `2.5`.
+            `defer_ephemeral` (`Optional[bool]`): Whether commands and modal submissions are deferred as ephemeral messages, unless their decorator says otherwise. Defaults to `False`.
+            `listener_workers` (`Optional[int]`): Number of `background` listeners run at once. Defaults to `4`.
+            `listener_queue_size` (`Optional[int]`): Maximum number of queued `background` listener calls. Defaults to `1000`.
+            `listener_overflow` (`Optional[str]`): What to do when the listener queue is full: `"drop_oldest"`, `"drop_newest"` or `"block"`. Defaults to `"drop_oldest"`.
+            `task_workers` (`Optional[int]`): Number of background tasks run at once. Defaults to `8`.
+            `task_queue_size` (`Optional[int]`): Maximum number of queued background tasks before `Interaction.background` waits for room. Defaults to `1000`.
+            `drain_timeout` (`Optional[float]`): Seconds to wait for background work to finish on shutdown. Defaults to `10.0`.
+            `autocomplete_cache_size` (`Optional[int]`): Maximum number of cached autocomplete results. Defaults to `4096`.
+            `autocomplete_cache_ttl` (`Optional[float]`): Seconds an autocomplete result is cached for. Defaults to `30.0`.
+            `api_base` (`Optional[str]`): Base URL of the Discord API, e.g. a `DiscordStandIn` for offline testing. Defaults to `"https://discord.com/api"`.
+            `metrics` (`Optional[bool]`): Record interaction, serialisation and REST timings, served on `/metrics` by `run()`. Defaults to `True`.
 
         Raises:
-            ValueError: Invalid token provided.
+            ValueError: Invalid public key provided.
         """
-        self.discord_prefix = f"https://discord.com/api/v{api_version}"
+        self.discord_prefix = f"{api_base.rstrip('/')}/v{api_version}"
         self.secret_key = secret_key
         self.public_key = public_key
         self.token = token
         self.port = port
         self.verbose: bool = verbose
-        self.session: Any = None
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.max_retries = max_retries
+        self.ratelimiter = RateLimiter()
+        self.sync_commands_on_startup = sync_commands
+        self.manifest_path = manifest_path
 
         self.autocomplete: dict = {}
         self.buttons: dict = {}
+        self.button_templates: dict = {}
         self.commands: dict = {}
         self.events: dict = {}
         self.interactions: dict = {}
         self.loaded_chunks: List[Chunk] = []
         self.menus: dict = {}
-        self.subcommands = {}
-
-        response = requests.get(
-            f"{self.discord_prefix}/users/@me",
-            headers = {
-                "Authorization": f"Bot {self.token}",
-                "Content-Type": "application/json",
-                "User-Agent": "GatePoint API Gateway"
-            }
+        self.menu_templates: dict = {}
+        self.modals: dict = {}
+        # Subcommand handlers keyed by their full path, e.g. "mod user ban".
+        self.subcommands: dict = {}
+        self.dispatcher: Optional[Dispatcher] = None
+
+        self.identity_cache_path = identity_cache_path
+        self.identity_cache_ttl = identity_cache_ttl
+        self.bot: Optional[Bot] = None
+        self.worker_id: int = 0
+        self.primary: bool = True
+        self.codec = JSONCodec(json_backend)
+        use_codec(self.codec)
+        self.defer_after = defer_after
+        self.defer_ephemeral = defer_ephemeral
+        # Per-handler overrides of `defer_ephemeral`, keyed like the dispatch table.
+        self.ephemeral_defers: Dict[Tuple[str, str], bool] = {}
+        self.deferred: Set[asyncio.Task] = set()
+        self.listener_queue = TaskQueue(
+            workers = listener_workers,
+            maxsize = listener_queue_size,
+            overflow = listener_overflow,
+            name = "listener"
+        )
+        self.tasks = TaskQueue(
+            workers = task_workers,
+            maxsize = task_queue_size,
+            overflow = "block",
+            name = "task"
+        )
+        self.drain_timeout = drain_timeout
+        self.autocomplete_cache = TTLCache(autocomplete_cache_size, autocomplete_cache_ttl)
+        self.metrics: Optional[Metrics] = Metrics() if metrics else None
+        self.verifier = Verifier(
+            public_key,
+            timestamp_window = timestamp_window,
+            executor = ThreadPoolExecutor(max_workers = verify_workers) if verify_workers else None
         )
-        if response.status_code == 200:
-            self.bot = Bot(response.json())
 
-        else:
+    async def start_session(self) -> "aiohttp.ClientSession":
+        """## Start Session
+        Opens the pooled HTTP session used for every Discord API request.
+        This is called for you when the Interaction API starts.
+
+        Returns:
+            `aiohttp.ClientSession`: The client's HTTP session.
+        """
+        loop = asyncio.get_running_loop()
+        if self.session is not None and self._session_loop is not loop:
+            # The session and rate-limit buckets belong to another loop, e.g. one
+            # closed after `asyncio.run(client.sync_commands())`, so they're replaced.
+            # The old loop may be closed, so its connections can't be awaited.
+            if not self.session.closed:
+                self.session.connector._close()
+            self.session = None
+            self.ratelimiter = RateLimiter(self.ratelimiter.sweep_interval)
+
+        if self.session is None or self.session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit = self.connection_limit,
+                keepalive_timeout = self.keepalive_timeout,
+                ttl_dns_cache = self.dns_cache_ttl,
+                use_dns_cache = True
+            )
+            self.session = aiohttp.ClientSession(
+                connector = connector,
+                headers = {
+                    "Authorization": f"Bot {self.token}",
+                    "Content-Type": "application/json",
+                    "User-Agent": "GatePoint API Gateway"
+                }
+            )
+            self._session_loop = loop
+        return self.session
+
+    async def close_session(self):
+        """## Close Session
+        Closes the pooled HTTP session and its connections.
+        This is called for you when the Interaction API shuts down.
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def _token_digest(self) -> str:
+        return hashlib.sha256(self.token.encode()).hexdigest()
+
+    def _load_identity(self) -> Optional[dict]:
+        if not self.identity_cache_path or not os.path.exists(self.identity_cache_path):
+            return None
+
+        try:
+            with open(self.identity_cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get("token") != self._token_digest():
+            return None
+
+        if time.time() - cache.get("fetched_at", 0) > self.identity_cache_ttl:
+            return None
+        return cache.get("bot")
+
+    def _save_identity(self, bot: Bot):
+        if not self.identity_cache_path:
+            return
+
+        # Workers may race to write the cache, so it's replaced atomically.
+        temporary_path = f"{self.identity_cache_path}.{os.getpid()}"
+        try:
+            with open(temporary_path, "w") as f:
+                json.dump({
+                    "token": self._token_digest(),
+                    "fetched_at": time.time(),
+                    "bot": bot.to_dict()
+                }, f, indent = 4)
+            os.replace(temporary_path, self.identity_cache_path)
+        except OSError as error:
+            output(f"Unable to write identity cache: {error}", "WARNING")
+
+    async def fetch_bot(self) -> Bot:
+        """## Fetch Bot
+        Returns the bot's identity, fetching `/users/@me` only when it isn't
+        already known or cached on disk. This is called for you when the
+        Interaction API starts.
+
+        Raises:
+            ValueError: Invalid token provided.
+
+        Returns:
+            `Bot`: The bot's identity.
+        """
+        if self.bot is not None:
+            return self.bot
+
+        cached = self._load_identity()
+        if cached:
+            self.bot = Bot(cached)
+            return self.bot
+
+        response = await self.request("GET", "/users/@me")
+        if "id" not in response:
             raise ValueError("Invalid token provided.")
 
+        self.bot = Bot(response)
+        self._save_identity(self.bot)
+        return self.bot
+
     async def request(self, method: str, endpoint: str, json: dict = None) -> dict:
         """## Discord API Request
         Sends a request to the Discord API.
@@ -98,19 +305,36 @@ class GatewayClient:
         Returns:
             dict: Response JSON from Discord API.
         """
-        async with aiohttp.ClientSession(
-            headers = {
-                "Authorization": f"Bot {self.token}",
-                "Content-Type": "application/json",
-                "User-Agent": "GatePoint API Gateway"
-            }
-        ) as session:
-            async with session.request(
-                method,
-                f"{self.discord_prefix}{endpoint}",
-                json = json
-            ) as response:
-                return await response.json()
+        session = await self.start_session()
+        # Encoded with the client's codec, which knows how to encode embeds and components.
+        body = self.codec.dumps(json) if json is not None else None
+        bucket = self.ratelimiter.get_bucket(method, endpoint)
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            async with bucket:
+                async with session.request(
+                    method,
+                    f"{self.discord_prefix}{endpoint}",
+                    data = body
+                ) as response:
+                    if self.metrics is not None:
+                        route = route_key(method, endpoint)[0]
+                        self.metrics.observe("gatepoint_rest_request_duration_seconds", (("route", route),), time.perf_counter() - start)
+                        self.metrics.inc("gatepoint_rest_requests_total", (("route", route), ("status", str(response.status))))
+
+                    bucket = self.ratelimiter.update(bucket, method, endpoint, response.headers)
+                    if response.status == 204:
+                        return {}
+
+                    data = await response.json()
+                    if response.status != 429 or attempt == self.max_retries:
+                        return data
+
+                    retry_after = float(data.get("retry_after") or response.headers.get("Retry-After", 1))
+                    is_global = data.get("global", False) or response.headers.get("X-RateLimit-Global") == "true"
+                    self.ratelimiter.ratelimit(bucket, retry_after, is_global)
+                    if self.verbose:
+                        output(f"Rate limited on {method} {endpoint}, retrying in {retry_after:.2f}s.", "WARNING")
 
     def command(
         self,
@@ -119,7 +343,8 @@ class GatewayClient:
         guild_ids: List[Snowflake] = None,
         options: List[dict] = None,
         dm_permission: bool = True,
-        default_permission: bool = True
+        default_permission: bool = True,
+        defer_ephemeral: Optional[bool] = None
     ):
         """## Command Decorator
         Slash Command that can be used in a Discord Server.
@@ -131,8 +356,16 @@ class GatewayClient:
             `options` (`Optional[list]`): Other options within the command. Defaults to `[]`.
             `dm_permission` (`Optional[bool]`): Whether the command is enabled in DMs. Defaults to `True`.
             `default_permission` (`Optional[bool]`): Whether the command is enabled by default when the app is added to a guild. Defaults to `True`.
+            `defer_ephemeral` (`Optional[bool]`): Whether the command is deferred as an ephemeral message when its handler is slow. Defaults to the client's `defer_ephemeral`.
+
+        Raises:
+            ValueError: The command already has subcommands.
         """
         def decorator(func: Callable):
+            existing = self.interactions.get(name)
+            if existing is not None and existing.has_subcommands:
+                raise ValueError(f"{name}: Commands with subcommands can't have a handler.")
+
             interaction = CommandInteraction(
                 name = name,
                 description = description,
@@ -141,27 +374,99 @@ class GatewayClient:
                 dm_permission = dm_permission,
                 default_permission = default_permission
             )
+            interaction.options = list(interaction.options or []) + getattr(func, "__gatepoint_options__", [])
             self.commands[interaction.name] = func
-            if interaction.guild_only:
-                for id_ in interaction.guild_ids:
-                    asyncio.run(
-                        self.request(
-                            "POST",
-                            f"/applications/{self.bot.id}/guilds/{id_}/commands",
-                            json = interaction.register_json
-                        )
-                    )
-            self.interactions[interaction.name] = interaction.register_json
+            self.interactions[interaction.name] = interaction
+            if defer_ephemeral is not None:
+                self.ephemeral_defers[("command", interaction.name)] = defer_ephemeral
+            self.dispatcher = None
             return func
         return decorator
 
+    def add_command(
+        self,
+        name: str,
+        description: str = None,
+        guild_ids: List[Snowflake] = None,
+        dm_permission: bool = True,
+        default_permission: bool = True
+    ) -> CommandInteraction:
+        """## Add Command
+        Slash Command without a handler of its own, used as the parent of subcommands.
+        Parents are created with default settings by `subcommand` when not added first.
+
+        Args:
+            `name` (`str`): Name of command.
+            `description` (`str`): Description of command. 
+            `guild_ids` (`Optional[List[Snowflake]]`): List of guild IDs to register command to. Defaults to `None`.
+            `dm_permission` (`Optional[bool]`): Whether the command is enabled in DMs. Defaults to `True`.
+            `default_permission` (`Optional[bool]`): Whether the command is enabled by default when the app is added to a guild. Defaults to `True`.
+
+        Raises:
+            ValueError: The command already has a handler.
+
+        Returns:
+            `CommandInteraction`: The command.
+        """
+        if name in self.commands:
+            raise ValueError(f"{name}: Commands with a handler can't have subcommands.")
+
+        existing = self.interactions.get(name)
+        interaction = CommandInteraction(
+            name = name,
+            description = description,
+            guild_ids = guild_ids,
+            options = existing.options if existing is not None else [],
+            dm_permission = dm_permission,
+            default_permission = default_permission
+        )
+        self.interactions[name] = interaction
+        return interaction
+
+    def add_subcommand_group(
+        self,
+        name: str,
+        parent: str,
+        description: str = None
+    ) -> SubCommandGroupInteraction:
+        """## Add Subcommand Group
+        Group of subcommands within a Slash Command.
+
+        Args:
+            `name` (`str`): Name of subcommand group.
+            `parent` (`str`): Name of the command the group belongs to.
+            `description` (`str`): Description of subcommand group.
+
+        Raises:
+            ValueError: The parent command has a handler, or already has a subcommand called `name`.
+
+        Returns:
+            `SubCommandGroupInteraction`: The subcommand group.
+        """
+        command = self.interactions.get(parent) or self.add_command(parent)
+        if parent in self.commands:
+            raise ValueError(f"{parent}: Commands with a handler can't have subcommands.")
+
+        group = command.child(name)
+        if group is None:
+            group = SubCommandGroupInteraction(name = name, description = description)
+            command.options.append(group)
+
+        elif not isinstance(group, SubCommandGroupInteraction):
+            raise ValueError(f"{parent} {name}: Already registered as a subcommand.")
+
+        elif description:
+            group.description = description
+        return group
+
     def add_option(
         self,
         type: Union[OptionType, str],
         name: str,
         description: str,
         options: Optional[list] = [],
-        required: Optional[bool] = False
+        required: Optional[bool] = False,
+        autocomplete: Optional[bool] = False
     ):
         """## Option Decorator
         Command Option that can be used in a Slash Command for parameter inputs.
@@ -172,6 +477,7 @@ class GatewayClient:
             `description` (`str`): Description of option parameter. 
             `options` (`Optional[list]`): Other options within the option. Defaults to `[]`.
             `required` (`Optional[bool]`): Is the option required to be filled in. Defaults to `False`.
+            `autocomplete` (`Optional[bool]`): Whether choices are suggested while the option is filled in. Defaults to `False`.
         """
         def decorator(func: Callable):
             option = CommandOption(
@@ -179,73 +485,282 @@ class GatewayClient:
                 name = name,
                 description = description,
                 options = options,
-                required = required
+                required = required,
+                autocomplete = autocomplete
             )
+            node = None
             for command_name, command_func in self.commands.items():
                 if command_func == func:
-                    self.commands[command_name].options.append(option)
+                    node = self.interactions[command_name]
+                    break
+
+            else:
+                for path, subcommand_func in self.subcommands.items():
+                    if subcommand_func == func:
+                        node = self._subcommand_node(path)
+                        break
+
+            # Decorators apply bottom-up, so each option goes in front of the ones
+            # added before it. Before the command decorator runs it collects these.
+            added = func.__dict__.setdefault("__gatepoint_options__", [])
+            if node is not None:
+                node.options.insert(len(node.options) - len(added), option)
+            added.insert(0, option)
             return func
         return decorator
 
-            `options` (`Optional[list]`): Other options within the command. Defaults to `[]`.
-            `dm_permission` (`Optional[bool]`): Whether the command is enabled in DMs. Defaults to `True`.
-            `default_permission` (`Optional[bool]`): Whether the command is enabled by default when the app is added to a guild. Defaults to `True`.
+    def _subcommand_node(self, path: str) -> SubCommandInteraction:
+        node = self.interactions[path.split(" ", 1)[0]]
+        for name in path.split(" ")[1:]:
+            node = node.child(name)
+        return node
+
+    def subcommand(
+        self,
+        name: str,
+        parent: str,
+        description: str = None,
+        group: str = None,
+        options: List[dict] = None,
+        defer_ephemeral: Optional[bool] = None
+    ):
+        """## Subcommand Decorator
+        Subcommand that can be used in a Slash Command, optionally within a subcommand group.
+        The routing tree is built here, so dispatch resolves `command → group → subcommand`
+        with a single lookup.
+
+        Args:
+            `name` (`str`): Name of subcommand.
+            `parent` (`str`): Name of the command the subcommand belongs to.
+            `description` (`str`): Description of subcommand.
+            `group` (`Optional[str]`): Name of the subcommand group the subcommand belongs to. Defaults to `None`.
+            `options` (`Optional[list]`): Other options within the subcommand. Defaults to `[]`.
+            `defer_ephemeral` (`Optional[bool]`): Whether the subcommand is deferred as an ephemeral message when its handler is slow. Defaults to the client's `defer_ephemeral`.
+
+        Raises:
+            ValueError: The parent command has a handler, or already has a child called `name`.
+
+        ## Example::
+
+            @InteractionAPI.subcommand("ban", parent = "mod", group = "user")
+            async def ban(interaction, member):
+                ...
         """
         def decorator(func: Callable):
-            if name not in self.subcommands:
-                self.subcommands[name] = func
+            if group is not None:
+                node = self.add_subcommand_group(group, parent)
+
+            else:
+                node = self.interactions.get(parent) or self.add_command(parent)
+                if parent in self.commands:
+                    raise ValueError(f"{parent}: Commands with a handler can't have subcommands.")
+
+            path = " ".join(part for part in (parent, group, name) if part is not None)
+            existing = node.child(name)
+            if existing is not None and path not in self.subcommands:
+                raise ValueError(f"{path}: Already registered as a subcommand group.")
+
+            interaction = SubCommandInteraction(
+                name = name,
+                description = description,
+                options = list(options or []) + getattr(func, "__gatepoint_options__", [])
+            )
+            if existing is not None:
+                node.options[node.options.index(existing)] = interaction
+
+            else:
+                node.options.append(interaction)
+
+            self.subcommands[path] = func
+            if defer_ephemeral is not None:
+                self.ephemeral_defers[("command", path)] = defer_ephemeral
+            self.dispatcher = None
             return func
-            if not description:
-                decorator.parent = description
+        return decorator
+
+    def _command_scopes(self) -> Dict[str, List[dict]]:
+        scopes: Dict[str, List[dict]] = {}
+        completed: Dict[str, set] = {}
+        for command, option in self.autocomplete:
+            completed.setdefault(command, set()).add(option)
+
+        for interaction in self.interactions.values():
+            register_json = interaction.register_json
+            if interaction.name in completed:
+                mark_autocomplete(register_json["options"], completed[interaction.name])
+
+            if interaction.guild_only:
+                for id_ in interaction.guild_ids:
+                    scopes.setdefault(str(id_), []).append(register_json)
 
             else:
-                asyncio.run(
-                    self.request(
-                        "POST",
-                        f"/applications/{self.bot.id}/commands",
-                        json = interaction.register_json
-                    )
-                )
+                scopes.setdefault("global", []).append(register_json)
+        return scopes
+
+    def _load_manifest(self) -> dict:
+        if not self.manifest_path or not os.path.exists(self.manifest_path):
+            return {}
+
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get("application_id") != str(self.bot.id):
+            return {}
+        return manifest.get("scopes", {})
+
+    def _save_manifest(self, scopes: Dict[str, str]):
+        if not self.manifest_path:
+            return
+
+        try:
+            with open(self.manifest_path, "w") as f:
+                json.dump({"application_id": str(self.bot.id), "scopes": scopes}, f, indent = 4)
+        except OSError as error:
+            output(f"Unable to write command manifest: {error}", "WARNING")
+
+    async def sync_commands(self, force: bool = False) -> List[str]:
+        """## Sync Commands
+        Registers every command with Discord using one bulk overwrite per scope.
+        Scopes whose commands haven't changed since the last sync are skipped.
+        This is called for you when the Interaction API starts.
+
+        Args:
+            `force` (`bool`): Sync every scope even if it's unchanged. Defaults to `False`.
+
+        Returns:
+            `List[str]`: The scopes that were synced, `"global"` or a guild ID.
+        """
+        await self.fetch_bot()
+        manifest = self._load_manifest()
+        scopes = self._command_scopes()
+
+        # Scopes that no longer have commands are cleared. Others are never
+        # touched, so commands registered elsewhere aren't overwritten.
+        for scope in manifest:
+            scopes.setdefault(scope, [])
+
+        hashes = {}
+        synced = []
+        for scope, commands in scopes.items():
+            digest = hashlib.sha256(
+                json.dumps(commands, sort_keys = True, default = str).encode()
+            ).hexdigest()
+            hashes[scope] = digest
+            if not force and manifest.get(scope) == digest:
+                continue
+
+            endpoint = f"/applications/{self.bot.id}/commands" if scope == "global" else \
+                f"/applications/{self.bot.id}/guilds/{scope}/commands"
+            response = await self.request("PUT", endpoint, json = commands)
+            if isinstance(response, dict) and "message" in response:
+                output(f"Unable to sync commands for {scope}: {response['message']}", "ERROR")
+                hashes.pop(scope)
+                continue
+            synced.append(scope)
+
+        self._save_manifest({
+            scope: digest
+            for scope, digest in hashes.items()
+            if scopes[scope]
+        })
+        if self.verbose:
+            output(f"Synced commands for {len(synced)} of {len(scopes)} scopes.")
+        return synced
+
+    def autocompleter(self, command: str, option: str, cache: bool = True):
+        """## Autocomplete Decorator
+        Suggests choices while a command option is filled in. The handler
+        receives the interaction and the option's current value, and returns
+        `Choice`s, strings, `(name, value)` tuples or a `ChoiceIndex` to search.
+        Only the first 25 choices are sent.
+
+        Args:
+            `command` (`str`): Name of command.
+            `option` (`str`): Name of the option to suggest choices for.
+            `cache` (`bool`): Cache results for each value typed. Defaults to `True`.
+        """
+        def decorator(func: Callable):
+            self.autocomplete[(command, option)] = Autocompleter(
+                command,
+                option,
+                func,
+                cache = self.autocomplete_cache if cache else None
+            )
+            self.dispatcher = None
             return func
         return decorator
 
     def button(self, custom_id: str):
         """## Button Decorator
         Button that can be used in a Discord Bot.
+        The `custom_id` may be a template such as `vote:{poll_id:int}:{choice}`,
+        whose parsed parameters are passed to the handler as keyword arguments.
 
         Args:
-            `custom_id` (`str`): Custom ID of button.
+            `custom_id` (`str`): Custom ID or Custom ID template of button.
         """
         def decorator(func: Callable):
             interaction = ButtonInteraction(custom_id = custom_id)
-            self.buttons[interaction.custom_id] = func
+            if PARAMETER.search(custom_id):
+                self.button_templates[CustomIdTemplate(custom_id).template] = func
+
+            else:
+                self.buttons[interaction.custom_id] = func
+            self.dispatcher = None
             return func
         return decorator
 
     def menu(self, custom_id: str):
         """## Menu Decorator
         Menu that can be used in a Discord Bot.
+        The `custom_id` may be a template such as `poll:{poll_id:int}`,
+        whose parsed parameters are passed to the handler as keyword arguments.
 
         Args:
-            `custom_id` (`str`): Custom ID of menu.
+            `custom_id` (`str`): Custom ID or Custom ID template of menu.
         """
         def decorator(func: Callable):
             interaction = MenuInteraction(custom_id = custom_id)
-            self.menus[interaction.custom_id] = func
+            if PARAMETER.search(custom_id):
+                self.menu_templates[CustomIdTemplate(custom_id).template] = func
+
+            else:
+                self.menus[interaction.custom_id] = func
+            self.dispatcher = None
             return func
         return decorator
 
-    def on(self, event: str):
+    def on(self, event: str, mode: str = "inline"):
         """## Event Decorator
         Events that are fired on your Discord Bot.
 
         Args:
             `event` (`str`): Event name.
+            `mode` (`str`): How the listener is run: `"inline"` before the handler, `"concurrent"` alongside it, or `"background"` without delaying the response. Defaults to `"inline"`.
         """
         def decorator(func: Callable):
-            event_list = self.events.get(event).append(func) if self.events.get(event) else [func]
-            self.events[event] = event_list
+            self.events.setdefault(event, []).append(Listener(func, mode))
+            self.dispatcher = None
+            return func
+        return decorator
 
+    def modal(self, custom_id: str, defer_ephemeral: Optional[bool] = None):
+        """## Modal Decorator
+        Modal submission that can be used in a Discord Bot.
+        The handler receives the submitted values keyed by their `custom_id`.
+
+        Args:
+            `custom_id` (`str`): Custom ID of modal.
+            `defer_ephemeral` (`Optional[bool]`): Whether the submission is deferred as an ephemeral message when its handler is slow. Defaults to the client's `defer_ephemeral`.
+        """
+        def decorator(func: Callable):
+            self.modals[custom_id] = func
+            if defer_ephemeral is not None:
+                self.ephemeral_defers[("modal", custom_id)] = defer_ephemeral
+            self.dispatcher = None
             return func
         return decorator
 
@@ -264,6 +779,7 @@ class GatewayClient:
 
         for menu in chunk.menus:
             self.menus[menu.custom_id] = menu
+        self.dispatcher = None
 
     def import_chunks(self, chunks: List[Chunk]):
         """## Import Chunks
@@ -290,6 +806,7 @@ class GatewayClient:
 
         for menu in chunk.menus:
             self.menus.pop(menu.custom_id)
+        self.dispatcher = None
 
     def offload_chunks(self, chunks: List[Chunk]):
         """## Offload Chunks
@@ -301,150 +818,351 @@ class GatewayClient:
         for chunk in chunks:
             self.offload_chunk(chunk)
 
-    def run(self):
+    async def dispatch(self, interaction_payload: dict) -> Union[dict, bytes, Reply]:
+        """## Dispatch
+        Runs the handler for a verified interaction payload.
+
+        Args:
+            `interaction_payload` (`dict`): Parsed interaction sent from Discord.
+
+        Raises:
+            ValueError: Interaction type not recognised.
+
+        Returns:
+            `Union[dict, bytes, Reply]`: Payload to send to Discord, or its pre-encoded body.
+        """
+        if self.dispatcher is None:
+            self.dispatcher = Dispatcher(self)
+        return await self.dispatcher.dispatch(interaction_payload)
+
+    async def startup(self):
+        """## Startup
+        Prepares the client to receive interactions and fires `startup` events.
+        The primary worker also syncs commands and fires `primary_startup` events,
+        which run once no matter how many workers are serving.
+        This is called for you by `run()` and `InteractionApp`.
+        """
+        await self.start_session()
+        await self.fetch_bot()
+        if self.primary:
+            if self.sync_commands_on_startup:
+                await self.sync_commands()
+
+            for event in self.events.get("primary_startup") or []:
+                event: Callable
+                await event()
+        self.dispatcher = Dispatcher(self)
+        self.listener_queue.start()
+        self.tasks.start()
+        output("GatePoint API Dispatched, listening for interactions.")
+        for event in self.events.get("startup") or []:
+            event: Callable
+            await event()
+
+    async def shutdown(self):
+        """## Shutdown
+        Releases the client's resources.
+        This is called for you by `run()` and `InteractionApp`.
+        """
+        if self.deferred:
+            _, pending = await asyncio.wait(set(self.deferred), timeout = self.drain_timeout)
+            if pending:
+                output(f"Abandoned {len(pending)} deferred responses on shutdown.", "WARNING")
+                for delivery in pending:
+                    delivery.cancel()
+                await asyncio.wait(pending)
+        for queue in (self.tasks, self.listener_queue):
+            await queue.drain(self.drain_timeout)
+            await queue.stop()
+        await self.close_session()
+
+    async def process(self, signature: Optional[str], timestamp: Optional[str], body: bytes) -> Tuple[int, bytes]:
+        """## Process
+        Verifies, dispatches and encodes a raw interaction request.
+
+        Args:
+            `signature` (`Optional[str]`): Value of the `X-Signature-Ed25519` header.
+            `timestamp` (`Optional[str]`): Value of the `X-Signature-Timestamp` header.
+            `body` (`bytes`): Raw request body.
+
+        Returns:
+            `Tuple[int, bytes]`: HTTP status code and encoded response body.
+        """
+        status, body = await self._process(signature, timestamp, body)
+        if self.metrics is not None:
+            self.metrics.inc("gatepoint_responses_total", (("status", str(status)),))
+        return status, body
+
+    async def _process(self, signature: Optional[str], timestamp: Optional[str], body: bytes) -> Tuple[int, bytes]:
+        metrics = self.metrics
+        if not signature or not timestamp:
+            return 401, self.codec.dumps({"detail": "missing request signature"})
+
+        start = time.perf_counter()
+        valid = await self.verifier.verify_async(signature, timestamp, body)
+        verified = time.perf_counter()
+        if metrics is not None:
+            metrics.observe("gatepoint_verify_seconds", (), verified - start)
+
+        if not valid:
+            return 401, self.codec.dumps({"detail": "invalid request signature"})
+
+        try:
+            interaction_payload = self.codec.loads(body)
+        except ValueError:
+            return 400, self.codec.dumps({"detail": "invalid request body"})
+
+        if metrics is not None:
+            metrics.observe("gatepoint_parse_seconds", (), time.perf_counter() - verified)
+
+        if not isinstance(interaction_payload, dict) or type(interaction_payload.get("type")) is not int \
+                or not 1 <= interaction_payload["type"] < 12:
+            return 400, self.codec.dumps({"detail": "Interaction not recognised by Interaction Gateway API."})
+
+        response = await self.dispatch_within_deadline(interaction_payload)
+        start = time.perf_counter()
+        content = self.encode(response)
+        if metrics is not None:
+            metrics.observe("gatepoint_serialize_seconds", (), time.perf_counter() - start)
+        return 200, content
+
+    def encode(self, response: Union[dict, bytes, Reply]) -> bytes:
+        """## Encode
+        Encodes a handler's response, passing pre-encoded bodies through untouched.
+
+        Args:
+            `response` (`Union[dict, bytes, Reply]`): The handler's response.
+
+        Returns:
+            `bytes`: Response body to send to Discord.
+        """
+        if isinstance(response, bytes):
+            return response
+
+        elif isinstance(response, Reply):
+            return response.render()
+        return self.codec.dumps(response)
+
+    async def dispatch_within_deadline(self, interaction_payload: dict) -> Union[dict, bytes, Reply]:
+        """## Dispatch Within Deadline
+        Dispatches an interaction, deferring it if the handler doesn't return
+        within `defer_after` seconds. Discord only waits 3 seconds for the
+        initial response, so slow handlers keep running and their result is
+        sent as an edit of the original response.
+
+        Components are deferred as an update of their message. Commands and
+        modal submissions are deferred as a new message, which is ephemeral
+        when `defer_ephemeral` says so, as the flag can't be changed later.
+
+        Args:
+            `interaction_payload` (`dict`): Parsed interaction sent from Discord.
+
+        Returns:
+            `Union[dict, bytes, Reply]`: Payload to send to Discord.
+        """
+        # Pings and autocomplete can't be deferred.
+        if self.defer_after is None or interaction_payload["type"] in (1, 4):
+            return await self.dispatch(interaction_payload)
+
+        task = asyncio.ensure_future(self.dispatch(interaction_payload))
+        done, _ = await asyncio.wait({task}, timeout = self.defer_after)
+        if done:
+            return task.result()
+
+        if self.metrics is not None:
+            self.metrics.inc("gatepoint_deferred_total")
+
+        deferral = self.deferral(interaction_payload)
+        delivery = asyncio.ensure_future(self.deliver_deferred(task, interaction_payload, deferral["type"]))
+        self.deferred.add(delivery)
+        delivery.add_done_callback(self.deferred.discard)
+        return deferral
+
+    def deferral(self, interaction_payload: dict) -> dict:
+        """## Deferral
+        Returns the response deferring an interaction.
+
+        Args:
+            `interaction_payload` (`dict`): Parsed interaction sent from Discord.
+
+        Returns:
+            `dict`: A deferred update for components, otherwise a deferred message.
+        """
+        if interaction_payload["type"] == 3:
+            return {
+                "type": 6
+            }
+
+        resolved = Dispatcher.resolve(interaction_payload)
+        ephemeral = self.ephemeral_defers.get(resolved[:2], self.defer_ephemeral) if resolved else self.defer_ephemeral
+        if ephemeral:
+            return {
+                "type": 5,
+                "data": {
+                    "flags": 64
+                }
+            }
+        return {
+            "type": 5
+        }
+
+    async def deliver_deferred(self, task: asyncio.Future, interaction_payload: dict, deferral_type: int = 5):
+        """## Deliver Deferred
+        Waits for a deferred handler and edits the original response with its
+        result. A new message from a component's handler is sent as a follow-up,
+        as the original response is the component's message.
+
+        Args:
+            `task` (`asyncio.Future`): The running handler.
+            `interaction_payload` (`dict`): Parsed interaction sent from Discord.
+            `deferral_type` (`int`): Type of the deferred response that was sent. Defaults to `5`.
+        """
+        webhook = f"/webhooks/{interaction_payload['application_id']}/{interaction_payload['token']}"
+        try:
+            response = await task
+        except Exception as error:
+            output(f"Deferred handler for interaction {interaction_payload.get('id')} failed: {error!r}", "ERROR")
+            response = {
+                "type": 4,
+                "data": {
+                    "content": "This interaction failed to respond in Interaction Gateway API.",
+                    "flags": 64
+                }
+            }
+
+        try:
+            if isinstance(response, (bytes, Reply)):
+                response = self.codec.loads(self.encode(response))
+
+            if not isinstance(response, dict) or not response.get("data"):
+                return
+
+            if deferral_type == 6 and response.get("type") == 4:
+                result = await self.request("POST", webhook, json = response["data"])
+
+            else:
+                result = await self.request("PATCH", f"{webhook}/messages/@original", json = response["data"])
+        except Exception as error:
+            result = {"message": repr(error)}
+
+        if isinstance(result, dict) and "message" in result:
+            output(f"Unable to deliver deferred response for interaction {interaction_payload.get('id')}: {result['message']}", "ERROR")
+
+    def asgi_app(self, path: Optional[str] = None) -> InteractionApp:
+        """## ASGI App
+        Builds a minimal ASGI application serving this client's interactions.
+
+        Args:
+            `path` (`Optional[str]`): Only accept interactions on this path. Defaults to any path.
+
+        Returns:
+            `InteractionApp`: ASGI application to mount under any ASGI server.
+        """
+        return InteractionApp(self, path = path)
+
+    def serverless_handler(self, drain: bool = True) -> ServerlessHandler:
+        """## Serverless Handler
+        Builds a function-style handler serving this client's interactions
+        from raw HTTP events, for serverless platforms.
+
+        Args:
+            `drain` (`bool`): Finish background tasks and listeners before returning. Defaults to `True`.
+
+        Returns:
+            `ServerlessHandler`: Callable taking an event and returning its response.
+        """
+        return ServerlessHandler(self, drain = drain)
+
+    def run(
+        self,
+        host: Optional[str] = "127.0.0.1",
+        workers: Optional[int] = 1,
+        backlog: Optional[int] = 2048,
+        uds: Optional[str] = None,
+        fd: Optional[int] = None,
+        timeout_keep_alive: Optional[int] = 5
+    ):
         """## Run
         Runs the Interaction API.
 
+        Args:
+            `host` (`Optional[str]`): The address your API will be hosted on. Defaults to `"127.0.0.1"`.
+            `workers` (`Optional[int]`): Number of worker processes sharing the listening socket. Defaults to `1`.
+            `backlog` (`Optional[int]`): Maximum number of pending connections. Defaults to `2048`.
+            `uds` (`Optional[str]`): Listen on this Unix domain socket path instead of `host` and `port`. Defaults to `None`.
+            `fd` (`Optional[int]`): Listen on an inherited socket file descriptor, e.g. from socket activation. Defaults to `None`.
+            `timeout_keep_alive` (`Optional[int]`): Seconds an idle keep-alive connection is held open. Defaults to `5`.
+
         ## Troubleshooting
         - If you require assistance/help, you may contact us at [Discord](https://discord.gg/5YY3W83YWg).
         - If your bot stops as soon as you run it, you can view by specifying `verbose = True` in GatewayClient.
         - If you are getting an error saying that the port is already in use, you fix it by mentioning a port in GatewayClient like `port = 8000` as an argument.
+        - If your reverse proxy runs on the same host, pass `uds = "/run/gatepoint.sock"` to skip TCP loopback.
         - If your bot stops responding to interactions, you can fix it by restarting the bot.
+        - Work that must only happen once when running several workers, belongs in a `primary_startup` event.
         """
+        import uvicorn
+        from fastapi import FastAPI, Request, Response
+
         app = FastAPI()
 
         @app.on_event("startup")
         async def startup_event():
-            output("GatePoint API Dispatched, listening for interactions.")
-            for event in self.events.get("startup") or []:
-                event: Callable
-                await event()
+            await self.startup()
+
+        @app.on_event("shutdown")
+        async def shutdown_event():
+            await self.shutdown()
 
         @app.get("/")
         async def index():
             return "This is a Discord Interaction API."
 
+        @app.get("/metrics")
+        async def metrics():
+            if self.metrics is None:
+                return Response(status_code = 404)
+
+            return Response(
+                content = self.metrics.render(),
+                media_type = "text/plain; version=0.0.4"
+            )
+
         @app.post("/interaction")
         async def interaction(request: Request):
-            # Verify the request.
-            verify_key = VerifyKey(bytes.fromhex(self.public_key))
-            signature = request.headers.get("X-Signature-Ed25519")
-            timestamp = request.headers.get("X-Signature-Timestamp")
-
-            if not signature or not timestamp:
-                raise HTTPException(
-                    detail = 'missing request signature',
-                    status_code = 401
-                )
-
-            body = (await request.body()).decode("utf-8")
-
-            try:
-                verify_key.verify(f'{timestamp}{body}'.encode(), bytes.fromhex(signature))
-            except BadSignatureError:
-                return HTTPException(
-                    detail = 'invalid request signature',
-                    status_code = 401
-                )
-
-            # Process the request.
-            interaction_payload = await request.json()
-
-            if interaction_payload["type"] == 1:
-                return {
-                    "type": 1
-                }
+            status, body = await self.process(
+                request.headers.get("X-Signature-Ed25519"),
+                request.headers.get("X-Signature-Timestamp"),
+                await request.body()
+            )
+            return Response(
+                content = body,
+                status_code = status,
+                media_type = "application/json"
+            )
 
-            elif interaction_payload["type"] == 2:
-                if interaction_payload["data"]["name"] in self.commands:
-                    print(self.events)
-                    for event in self.events.get("interaction_receive") or []:
-                        event: Callable
-                        await event(Interaction(interaction_payload))
-
-                    for event in self.events.get("command_receive") or []:
-                        event: Callable
-                        await event(Interaction(interaction_payload))
-
-                    if interaction_payload.get("data").get("options"):
-                        input_tuple = ()
-                        for option in interaction_payload["data"]["options"]:
-                            input_tuple = input_tuple.__add__((option["value"]))
-
-                        return await self.commands[interaction_payload["data"]["name"]](Interaction(interaction_payload), *input_tuple)
-
-                    else:
-                        return await self.commands[interaction_payload["data"]["name"]](Interaction(interaction_payload))
-
-                return {
-                    "type": 4,
-                    "data": {
-                        "content": "This command is not registered with Interaction Gateway API.",
-                        "flags": 64
-                    }
-                }
+        config = uvicorn.Config(
+            app,
+            host = host,
+            port = self.port,
+            uds = uds,
+            fd = fd,
+            backlog = backlog,
+            timeout_keep_alive = timeout_keep_alive,
+            log_level = None if self.verbose else "critical"
+        )
 
-            elif interaction_payload["type"] == 3:
-                print(interaction_payload["data"])
-                if interaction_payload["data"]["component_type"] in (3, 4, 5, 6, 7, 8):
-                    value = interaction_payload["data"]["values"][0] if interaction_payload["data"]["values"] else None
-                    if interaction_payload["data"]["custom_id"] in self.menus:
-                        for event in self.events.get("interaction_receive") or []:
-                            event: Callable
-                            await event(Interaction(interaction_payload))
-
-                        for event in self.events.get("menu_select") or []:
-                            event: Callable
-                            await event(Interaction(interaction_payload))
-
-                        return await self.menus[interaction_payload["data"]["custom_id"]](Interaction(interaction_payload), interaction_payload["data"]["values"])
-
-                    return {
-                        "type": 4,
-                        "data": {
-                            "content": "This menu is not registered with Interaction Gateway API.",
-                            "flags": 64
-                        }
-                    }
-
-                elif interaction_payload["data"]["custom_id"] in self.buttons:
-                    for event in self.events.get("interaction_receive") or []:
-                        event: Callable
-                        await event(Interaction(interaction_payload))
-
-                    for event in self.events.get("button_click") or []:
-                        event: Callable
-                        await event(Interaction(interaction_payload))
-
-                    return await self.buttons[interaction_payload["data"]["custom_id"]](Interaction(interaction_payload))
-
-                return {
-                    "type": 4,
-                    "data": {
-                        "content": "This button is not registered with Interaction Gateway API.",
-                        "flags": 64
-                    }
-                }
+        if workers > 1 and not hasattr(os, "fork"):
+            output("Multiple workers require os.fork, running a single worker.", "WARNING")
+            workers = 1
 
-            elif interaction_payload["type"] >= 4 or interaction_payload["type"] < 12:
-                return {
-                    "type": 4,
-                    "data": {
-                        "content": "This interaction is not yet supported by Interaction Gateway API.",
-                        "flags": 64
-                    }
-                }
+        if workers > 1:
+            from .workers import Supervisor
+            Supervisor(self, config, workers).run()
 
-            else:
-                raise HTTPException(detail = "Interaction not recognised by Interaction Gateway API.", status_code = 400)
+        elif fd is not None:
+            from .workers import listening_socket
+            uvicorn.Server(config).run(sockets = [listening_socket(config)])
 
-        uvicorn.run(
-            app,
-            host = "127.0.0.1",
-            port = self.port
-        ) if self.verbose else uvicorn.run(
-            app,
-            log_level = "critical",
-            host = "127.0.0.1",
-            port = self.port
-        )
\ No newline at end of file
+        else:
+            uvicorn.Server(config).run()
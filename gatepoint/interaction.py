@@ -1,30 +1,97 @@
-import json
-from typing import List
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
 
 from .components.component import ActionRow
+from .objects import User, Member, Channel, Resolved
+from .responses import reply_payload
+
+if TYPE_CHECKING:
+    from .gateway import GatewayClient
 
 class DictObject:
+    """## Dict Object
+    Attribute view over a payload dict. Values are only wrapped when they are
+    first accessed and are then cached on the instance, so untouched parts of
+    large payloads cost nothing.
+    """
     def __init__(self, json: dict):
-        for key, value in json.items():
-            if isinstance(value, dict):
-                setattr(self, key, DictObject(value))
-                continue
-            setattr(self, key, value)
+        self.json_ = json
+
+    def __getattr__(self, name: str):
+        # Only called when `name` isn't cached on the instance yet.
+        try:
+            value = self.__dict__["json_"][name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+
+        if isinstance(value, dict):
+            value = DictObject(value)
+        self.__dict__[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.json_!r}>"
 
-class Interaction:
+    def to_dict(self) -> dict:
+        return self.json_
+
+class Interaction(DictObject):
     """## Interaction Object
     Represents the interaction sent from Discord.
     """
-    def __init__(self, interaction_payload: dict):
+    def __init__(self, interaction_payload: dict, client: "GatewayClient" = None):
         self.json_ = interaction_payload
-        for key, value in interaction_payload.items():
-            if isinstance(value, dict):
-                setattr(self, key, DictObject(value))
-                continue
-            setattr(self, key, value)
+        self.client = client
 
-    def to_dict(self) -> dict:
-        return self.json_
+    @cached_property
+    def user(self) -> Optional[User]:
+        """The user who invoked the interaction, in guilds and DMs alike."""
+        payload = self.json_.get("user") or (self.json_.get("member") or {}).get("user")
+        return User.from_payload(payload) if payload else None
+
+    @cached_property
+    def member(self) -> Optional[Member]:
+        """The member who invoked the interaction, `None` outside guilds."""
+        payload = self.json_.get("member")
+        return Member.from_payload(payload) if payload else None
+
+    @cached_property
+    def channel(self) -> Optional[Channel]:
+        """The channel the interaction was invoked in."""
+        payload = self.json_.get("channel")
+        return Channel.from_payload(payload) if payload else None
+
+    @cached_property
+    def resolved(self) -> Resolved:
+        """Users, members, roles, channels and attachments referenced by the interaction's options."""
+        return Resolved.from_payload((self.json_.get("data") or {}).get("resolved") or {})
+
+    async def background(self, func: Callable, *args) -> bool:
+        """## Interaction.background
+        Runs work such as logging or follow-ups after you've replied, on the
+        client's bounded background task queue. Waits for room if the queue
+        is full, and any remaining work is finished on shutdown.
+
+        Args:
+            `func` (`Callable`): Coroutine function to run.
+            `*args`: Arguments passed to `func`.
+
+        Raises:
+            `RuntimeError`: The interaction isn't attached to a client.
+
+        Returns:
+            `bool`: Whether the task was queued.
+
+        ## Example::
+
+            @InteractionAPI.command("example")
+            async def example(interaction):
+                await interaction.background(log_usage, interaction.user.id)
+                return interaction.reply("Logged!")
+        """
+        if self.client is None:
+            raise RuntimeError("Interaction is not attached to a GatewayClient.")
+        return await self.client.tasks.put(func, *args)
 
     def respond(self, response: dict) -> dict:
         """## Interaction.respond
@@ -57,8 +124,11 @@ class Interaction:
             `ephemeral` (`bool`): Whether the message is ephemeral.
             `flags` (`int`): Message flags.
 
+        Raises:
+            ValueError: Neither content nor embeds provided.
+
         Returns:
-            `dict`: Payload to send to Discord.
+            `dict`: Payload to send to Discord. Use `Reply` for replies that don't change.
 
         ## Example::
 
@@ -70,30 +140,7 @@ class Interaction:
                 )
             # Test the command by typing `/example` in a Discord Server.
         """
-        payload = {
-            "type": 4,
-            "data": {
-                "flags": 64 if ephemeral and not flags else flags
-            }
-        }
-
-        if not content and not embeds:
-            raise ValueError("You must provide a content or embeds.")
-
-        if content:
-            payload["data"]["content"] = content
-
-        if embeds:
-            payload["data"]["embeds"] = embeds
-
-        if components:
-            payload["data"]["components"] = [
-                component.to_dict()
-                for component in components
-            ]
-        print(json.dumps(payload))
-
-        return payload
+        return reply_payload(content, components, embeds, ephemeral, flags)
 
 class Snowflake(int):
     def __init__(self, snowflake: int):
@@ -140,16 +187,107 @@ class CommandInteraction:
         self.dm_permission = dm_permission
         self.default_permission = default_permission
 
-        self.register_json = {
+
+    @property
+    def register_json(self) -> dict:
+        return {
             "name": self.name,
             "description": self.description,
-            "options": self.options,
+            "options": [
+                option.to_dict() if hasattr(option, "to_dict") else option
+                for option in self.options or []
+            ],
+            "dm_permission": self.dm_permission,
             "default_permission": self.default_permission
         }
 
     def __dict__(self) -> dict:
         return self.register_json
 
+    def child(self, name: str) -> Optional[Union["SubCommandInteraction", "SubCommandGroupInteraction"]]:
+        """## CommandInteraction.child
+        Returns the subcommand or subcommand group called `name`.
+
+        Args:
+            `name` (`str`): Name of the subcommand or subcommand group.
+
+        Returns:
+            `Optional[Union[SubCommandInteraction, SubCommandGroupInteraction]]`: The child, `None` if there isn't one.
+        """
+        for option in self.options or ():
+            if isinstance(option, (SubCommandInteraction, SubCommandGroupInteraction)) and option.name == name:
+                return option
+        return None
+
+    @property
+    def has_subcommands(self) -> bool:
+        return any(
+            isinstance(option, (SubCommandInteraction, SubCommandGroupInteraction))
+            for option in self.options or ()
+        )
+
+class SubCommandGroupInteraction:
+    def __init__(
+        self,
+        name: str,
+        description: str = None,
+        options: list = None
+    ):
+        """## Subcommand Group Interaction Object
+        Group of subcommands within a Slash Command.
+
+        Args:
+            `name` (`str`): Name of subcommand group.
+            `description` (`str`): Description of subcommand group.
+            `options` (`Optional[list]`): Subcommands within the group. Defaults to `[]`.
+        """
+        self.name = name
+        self.description = description or "No description."
+        self.options = list(options or [])
+
+    child = CommandInteraction.child
+
+    def to_dict(self) -> dict:
+        return {
+            "type": 2,
+            "name": self.name,
+            "description": self.description,
+            "options": [
+                option.to_dict() if hasattr(option, "to_dict") else option
+                for option in self.options
+            ]
+        }
+
+class SubCommandInteraction:
+    def __init__(
+        self,
+        name: str,
+        description: str = None,
+        options: list = None
+    ):
+        """## Subcommand Interaction Object
+        Subcommand within a Slash Command or subcommand group.
+
+        Args:
+            `name` (`str`): Name of subcommand.
+            `description` (`str`): Description of subcommand.
+            `options` (`Optional[list]`): Other options within the subcommand. Defaults to `[]`.
+        """
+        self.name = name
+        self.description = description or "No description."
+        self.options = list(options or [])
+
+    def to_dict(self) -> dict:
+        return {
+            "type": 1,
+            "name": self.name,
+            "description": self.description,
+            "options": [
+                option.to_dict() if hasattr(option, "to_dict") else option
+                for option in self.options
+            ]
+        }
+
 class ButtonInteraction:
     def __init__(
         self,
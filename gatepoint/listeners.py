@@ -0,0 +1,45 @@
+from typing import Callable
+
+from .utils import output
+
+LISTENER_MODES = ("inline", "concurrent", "background")
+
+class Listener:
+    __slots__ = ("func", "mode", "__name__")
+
+    def __init__(self, func: Callable, mode: str = "inline"):
+        """## Listener
+        An event listener and how it's run when the event fires.
+
+        - `inline` listeners are awaited one by one before the handler.
+        - `concurrent` listeners run alongside the handler with `asyncio.gather`.
+        - `background` listeners are queued and run without delaying the response.
+
+        Errors in `concurrent` and `background` listeners are logged and never
+        affect the handler.
+
+        Args:
+            `func` (`Callable`): The listener.
+            `mode` (`str`): `"inline"`, `"concurrent"` or `"background"`. Defaults to `"inline"`.
+
+        Raises:
+            ValueError: Unknown mode provided.
+        """
+        if mode not in LISTENER_MODES:
+            raise ValueError(f"mode: Must be one of {', '.join(LISTENER_MODES)}.")
+
+        self.func = func
+        self.mode = mode
+        self.__name__ = getattr(func, "__name__", repr(func))
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+    async def isolated(self, *args):
+        """## Listener.isolated
+        Runs the listener, logging instead of raising any error.
+        """
+        try:
+            await self.func(*args)
+        except Exception as error:
+            output(f"Listener {self.__name__} failed: {error!r}", "ERROR")
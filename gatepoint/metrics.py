@@ -0,0 +1,127 @@
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+# Upper bounds in seconds, from sub-millisecond dispatch to Discord's 3 second deadline.
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+DESCRIPTIONS = {
+    "gatepoint_responses_total": "Interaction requests answered, by HTTP status.",
+    "gatepoint_verify_seconds": "Time spent verifying request signatures.",
+    "gatepoint_parse_seconds": "Time spent decoding request bodies.",
+    "gatepoint_serialize_seconds": "Time spent encoding responses.",
+    "gatepoint_interactions_total": "Interactions dispatched to a handler, by type and name.",
+    "gatepoint_interaction_errors_total": "Interactions whose handler raised, by type and name.",
+    "gatepoint_interaction_duration_seconds": "Time spent running listeners and the handler, by type and name.",
+    "gatepoint_unregistered_total": "Interactions with no registered handler, by type.",
+    "gatepoint_deferred_total": "Interactions deferred because the handler was too slow.",
+    "gatepoint_rest_requests_total": "Discord API requests, by route and HTTP status.",
+    "gatepoint_rest_request_duration_seconds": "Discord API request time including rate-limit waits, by route."
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...] = BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class Metrics:
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        """## Metrics
+        Counters and latency histograms recorded by the client, rendered in
+        the Prometheus text format. Recording is a dict lookup and a list
+        increment, so it's cheap enough for every interaction. Labels are
+        tuples of `(name, value)` pairs, and the dispatcher precomputes them
+        per route.
+
+        With several workers, each process keeps its own metrics.
+
+        Args:
+            `buckets` (`Tuple[float, ...]`): Histogram upper bounds in seconds.
+        """
+        self.buckets = buckets
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1):
+        """## Metrics.inc
+        Increments a counter.
+
+        Args:
+            `name` (`str`): Name of the counter.
+            `labels` (`Labels`): The counter's labels. Defaults to none.
+            `value` (`float`): Amount to add. Defaults to `1`.
+        """
+        key = (name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Labels, value: float):
+        """## Metrics.observe
+        Records a value, usually a duration in seconds, in a histogram.
+
+        Args:
+            `name` (`str`): Name of the histogram.
+            `labels` (`Labels`): The histogram's labels.
+            `value` (`float`): The value observed.
+        """
+        key = (name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def render(self) -> str:
+        """## Metrics.render
+        Renders every metric in the Prometheus text exposition format.
+
+        Returns:
+            `str`: The metrics page.
+        """
+        lines: List[str] = []
+        for name, series in group(self.counters.items()):
+            header(lines, name, "counter")
+            for labels, value in series:
+                lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+
+        for name, series in group(self.histograms.items()):
+            header(lines, name, "histogram")
+            for labels, histogram in series:
+                cumulative = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{format_labels(labels + (('le', format_value(bound)),))} {cumulative}")
+                lines.append(f"{name}_bucket{format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                lines.append(f"{name}_sum{format_labels(labels)} {format_value(histogram.sum)}")
+                lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+def group(items: Iterable) -> List[Tuple[str, list]]:
+    grouped: Dict[str, list] = {}
+    for (name, labels), value in items:
+        grouped.setdefault(name, []).append((labels, value))
+    return sorted(grouped.items())
+
+def header(lines: List[str], name: str, type_: str):
+    if name in DESCRIPTIONS:
+        lines.append(f"# HELP {name} {DESCRIPTIONS[name]}")
+    lines.append(f"# TYPE {name} {type_}")
+
+def escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels) + "}"
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
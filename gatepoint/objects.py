@@ -1,21 +1,110 @@
-class Emoji(dict):
+import inspect
+
+from typing import Dict, Tuple, Type
+
+class Model:
+    """## Model
+    Base class for Discord objects. Subclasses declare their fields with
+    `__slots__`, and get `from_payload` and `to_dict` generated for them
+    when the class is created, so neither walks the fields with reflection.
+    Fields listed in `__nested__` are converted with their model's `from_payload`.
+    """
+    __slots__ = ()
+    __fields__: Tuple[str, ...] = ()
+    __nested__: Dict[str, Type["Model"]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__fields__ = tuple(cls.__dict__.get("__slots__", ()))
+        parameters = inspect.signature(cls.__init__).parameters
+        namespace = {"new": object.__new__}
+
+        from_payload = ["def from_payload(cls, payload):", "    self = new(cls)", "    get = payload.get"]
+        to_dict = ["def to_dict(self):", "    return {"]
+        for field in cls.__fields__:
+            parameter = parameters.get(field)
+            if field in cls.__nested__:
+                namespace[f"nested_{field}"] = cls.__nested__[field].from_payload
+                from_payload.append(f"    value = get({field!r})")
+                from_payload.append(f"    self.{field} = None if value is None else nested_{field}(value)")
+                to_dict.append(f"        {field!r}: None if self.{field} is None else self.{field}.to_dict(),")
+
+            else:
+                if parameter is not None and parameter.default is inspect.Parameter.empty:
+                    from_payload.append(f"    self.{field} = payload[{field!r}]")
+
+                else:
+                    namespace[f"default_{field}"] = None if parameter is None else parameter.default
+                    from_payload.append(f"    self.{field} = get({field!r}, default_{field})")
+                to_dict.append(f"        {field!r}: self.{field},")
+        from_payload.append("    return self")
+        to_dict.append("    }")
+
+        if "from_payload" not in cls.__dict__:
+            exec("\n".join(from_payload), namespace)
+            cls.from_payload = classmethod(namespace["from_payload"])
+        if "to_dict" not in cls.__dict__:
+            exec("\n".join(to_dict), namespace)
+            cls.to_dict = namespace["to_dict"]
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "Model":
+        """## Model.from_payload
+        Builds the object from a Discord API payload.
+
+        Args:
+            `payload` (`dict`): Payload sent from Discord.
+
+        Returns:
+            `Model`: The object.
+        """
+        raise NotImplementedError
+
+    def to_dict(self) -> dict:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        fields = " ".join(f"{field}={getattr(self, field, None)!r}" for field in self.__fields__[:3])
+        return f"<{type(self).__name__} {fields}>"
+
+class Emoji(Model):
+    __slots__ = ("name", "id", "animated")
+
     def __init__(self, name: str, id: int = None, animated: bool = False):
         self.name = name
         self.id = id
         self.animated = animated
-        self._dict = {
-            "name": self.name,
-            "id": self.id,
-            "animated": self.animated
-        } if not animated else {
+
+    def to_dict(self) -> dict:
+        if self.animated:
+            return {
+                "name": self.name,
+                "id": self.id,
+                "animated": self.animated
+            }
+
+        return {
             "name": self.name,
             "id": self.id
         }
 
-    def to_dict(self) -> dict:
-        return self._dict
+class User(Model):
+    __slots__ = (
+        "username",
+        "discriminator",
+        "id",
+        "avatar",
+        "bot",
+        "system",
+        "mfa_enabled",
+        "locale",
+        "verified",
+        "email",
+        "flags",
+        "premium_type",
+        "public_flags"
+    )
 
-class User(dict):
     def __init__(
         self,
         username: str,
@@ -46,24 +135,19 @@ class User(dict):
         self.premium_type = premium_type
         self.public_flags = public_flags
 
-    def to_dict(self) -> dict:
-        return {
-            "username": self.username,
-            "discriminator": self.discriminator,
-            "id": self.id,
-            "avatar": self.avatar,
-            "bot": self.bot,
-            "system": self.system,
-            "mfa_enabled": self.mfa_enabled,
-            "locale": self.locale,
-            "verified": self.verified,
-            "email": self.email,
-            "flags": self.flags,
-            "premium_type": self.premium_type,
-            "public_flags": self.public_flags
-        }
+class Member(Model):
+    __slots__ = (
+        "user",
+        "nick",
+        "roles",
+        "joined_at",
+        "premium_since",
+        "deaf",
+        "mute",
+        "pending"
+    )
+    __nested__ = {"user": User}
 
-class Member(dict):
     def __init__(
         self,
         user: User,
@@ -84,19 +168,18 @@ class Member(dict):
         self.mute = mute
         self.pending = pending
 
-    def to_dict(self) -> dict:
-        return {
-            "user": self.user.to_dict(),
-            "nick": self.nick,
-            "roles": self.roles,
-            "joined_at": self.joined_at,
-            "premium_since": self.premium_since,
-            "deaf": self.deaf,
-            "mute": self.mute,
-            "pending": self.pending
-        }
+class Role(Model):
+    __slots__ = (
+        "id",
+        "name",
+        "color",
+        "hoist",
+        "position",
+        "permissions",
+        "managed",
+        "mentionable"
+    )
 
-class Role(dict):
     def __init__(
         self,
         id: int,
@@ -117,19 +200,28 @@ class Role(dict):
         self.managed = managed
         self.mentionable = mentionable
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "color": self.color,
-            "hoist": self.hoist,
-            "position": self.position,
-            "permissions": self.permissions,
-            "managed": self.managed,
-            "mentionable": self.mentionable
-        }
+class Channel(Model):
+    __slots__ = (
+        "id",
+        "type",
+        "guild_id",
+        "position",
+        "permission_overwrites",
+        "name",
+        "topic",
+        "nsfw",
+        "last_message_id",
+        "bitrate",
+        "user_limit",
+        "rate_limit_per_user",
+        "recipients",
+        "icon",
+        "owner_id",
+        "application_id",
+        "parent_id",
+        "last_pin_timestamp"
+    )
 
-class Channel(dict):
     def __init__(
         self,
         id: int,
@@ -170,29 +262,17 @@ class Channel(dict):
         self.parent_id = parent_id
         self.last_pin_timestamp = last_pin_timestamp
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "type": self.type,
-            "guild_id": self.guild_id,
-            "position": self.position,
-            "permission_overwrites": self.permission_overwrites,
-            "name": self.name,
-            "topic": self.topic,
-            "nsfw": self.nsfw,
-            "last_message_id": self.last_message_id,
-            "bitrate": self.bitrate,
-            "user_limit": self.user_limit,
-            "rate_limit_per_user": self.rate_limit_per_user,
-            "recipients": self.recipients,
-            "icon": self.icon,
-            "owner_id": self.owner_id,
-            "application_id": self.application_id,
-            "parent_id": self.parent_id,
-            "last_pin_timestamp": self.last_pin_timestamp
-        }
+class Attachment(Model):
+    __slots__ = (
+        "id",
+        "filename",
+        "size",
+        "url",
+        "proxy_url",
+        "height",
+        "width"
+    )
 
-class Attachment(dict):
     def __init__(self, id: int, filename: str, size: int, url: str, proxy_url: str, height: int = None, width: int = None):
         self.id = id
         self.filename = filename
@@ -202,18 +282,23 @@ class Attachment(dict):
         self.height = height
         self.width = width
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "filename": self.filename,
-            "size": self.size,
-            "url": self.url,
-            "proxy_url": self.proxy_url,
-            "height": self.height,
-            "width": self.width
-        }
+class Embed(Model):
+    __slots__ = (
+        "title",
+        "type",
+        "description",
+        "url",
+        "timestamp",
+        "color",
+        "footer",
+        "image",
+        "thumbnail",
+        "video",
+        "provider",
+        "author",
+        "fields"
+    )
 
-class Embed(dict):
     def __init__(
         self,
         title: str = None,
@@ -351,6 +436,72 @@ class Embed(dict):
         if self.timestamp:
             payload["timestamp"] = self.timestamp
 
+        return payload
+
+class Resolved(Model):
+    __slots__ = (
+        "users",
+        "members",
+        "roles",
+        "channels",
+        "attachments"
+    )
+
+    def __init__(
+        self,
+        users: Dict[str, User] = None,
+        members: Dict[str, Member] = None,
+        roles: Dict[str, Role] = None,
+        channels: Dict[str, Channel] = None,
+        attachments: Dict[str, Attachment] = None
+    ):
+        """## Resolved Object
+        Entities referenced by an interaction's options, keyed by their ID.
+        """
+        self.users = users or {}
+        self.members = members or {}
+        self.roles = roles or {}
+        self.channels = channels or {}
+        self.attachments = attachments or {}
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "Resolved":
+        users = {
+            id_: User.from_payload(user)
+            for id_, user in (payload.get("users") or {}).items()
+        }
+        members = {}
+        for id_, member in (payload.get("members") or {}).items():
+            # Resolved members don't include their user, it's in `users` instead.
+            members[id_] = Member.from_payload(member)
+            members[id_].user = users.get(id_)
+
+        return cls(
+            users = users,
+            members = members,
+            roles = {
+                id_: Role.from_payload(role)
+                for id_, role in (payload.get("roles") or {}).items()
+            },
+            channels = {
+                id_: Channel.from_payload(channel)
+                for id_, channel in (payload.get("channels") or {}).items()
+            },
+            attachments = {
+                id_: Attachment.from_payload(attachment)
+                for id_, attachment in (payload.get("attachments") or {}).items()
+            }
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            field: {
+                id_: entity.to_dict()
+                for id_, entity in getattr(self, field).items()
+            }
+            for field in self.__fields__
+        }
+
 class OptionType:
     SUB_COMMAND = 1
     SUB_COMMAND_GROUP = 2
@@ -360,6 +511,9 @@ class OptionType:
     USER = 6
     CHANNEL = 7
     ROLE = 8
+    MENTIONABLE = 9
+    NUMBER = 10
+    ATTACHMENT = 11
 
 class InteractionType:
     SLASH_COMMAND = 1
@@ -20,7 +20,8 @@ class CommandOption:
         name: str,
         description: str,
         options: Optional[list] = [],
-        required: Optional[bool] = False
+        required: Optional[bool] = False,
+        autocomplete: Optional[bool] = False
     ):
         """## Command Option
         Command Option that can be used in a Slash Command for parameter inputs.
@@ -31,22 +32,28 @@ class CommandOption:
             `description` (`str`): Description of option parameter. 
             `options` (`Optional[list]`): Other options within the option. Defaults to `[]`.
             `required` (`Optional[bool]`): Is the option required to be filled in. Defaults to `False`.
+            `autocomplete` (`Optional[bool]`): Whether choices are suggested while the option is filled in. Defaults to `False`.
         """
         self.type = type
         self.name = name
         self.description = description
         self.options = options
         self.required = required
+        self.autocomplete = autocomplete
 
     def to_dict(self):
-        return {
+        dict_ = {
             "type": self.type,
             "name": self.name,
             "description": self.description,
             "options": self.options,
             "required": self.required
         }
-        }
+
+        if self.autocomplete:
+            dict_["autocomplete"] = self.autocomplete
+
+        return dict_
 
 class MenuOption:
     def __init__(
@@ -0,0 +1,317 @@
+import asyncio
+import time
+
+from typing import Dict, Optional, Tuple
+
+MAJOR_PARAMETERS = ("channels", "guilds", "webhooks", "interactions")
+
+def route_key(method: str, endpoint: str) -> Tuple[str, str]:
+    """## Route Key
+    Splits an endpoint into its route template and major parameters.
+    Discord keys rate-limit buckets by route plus major parameter, so two
+    messages in the same channel share a bucket while different channels don't.
+
+    Args:
+        `method` (`str`): HTTP method of the request.
+        `endpoint` (`str`): Discord API endpoint, e.g. `/channels/123/messages/456`.
+
+    Returns:
+        `Tuple[str, str]`: The route template and the major parameters.
+    """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    route = []
+    major = []
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else None
+        if previous in MAJOR_PARAMETERS and segment.isdigit():
+            major.append(segment)
+            route.append(f"{{{previous}}}")
+
+        elif index >= 2 and segments[index - 2] in ("webhooks", "interactions") and previous.isdigit():
+            # The token following a webhook or interaction ID is part of the major parameter.
+            major.append(segment)
+            route.append("{token}")
+
+        elif previous == "reactions":
+            # Every emoji shares its message's reaction bucket, and custom ones contain a colon.
+            route.append("{emoji}")
+
+        elif segment.isdigit():
+            route.append("{id}")
+
+        else:
+            route.append(segment)
+
+    return f"{method.upper()} /{'/'.join(route)}", ":".join(major)
+
+class Bucket:
+    """## Rate Limit Bucket
+    A single Discord rate-limit bucket. Callers are released concurrently
+    while the bucket has requests remaining, and queue in order once it is
+    exhausted, sleeping until it resets. Until Discord reports the bucket's
+    limits, one request is sent at a time to discover them.
+    """
+    def __init__(self, key: str, limiter: "RateLimiter", major: str = ""):
+        self.key = key
+        self.limiter = limiter
+        self.major = major
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self.in_flight = 0
+
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+        # Held while a caller waits for its turn, never during the request itself.
+        self._lock = asyncio.Lock()
+        self._settled = asyncio.Event()
+
+    @property
+    def idle(self) -> bool:
+        """Whether nothing is queued on the bucket and its limits have reset."""
+        return not self.in_flight and not self.queue_depth and not self._lock.locked() \
+            and self.reset_at <= time.monotonic()
+
+    async def _settle(self):
+        # Waits for a request in flight to finish and report the bucket's state.
+        self._settled.clear()
+        await self._settled.wait()
+
+    async def __aenter__(self) -> "Bucket":
+        started = time.monotonic()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await self._lock.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        try:
+            while True:
+                await self.limiter.wait_global()
+                if self.remaining == 0:
+                    delay = self.reset_at - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                    elif self.in_flight:
+                        await self._settle()
+
+                    else:
+                        self.remaining = self.limit
+
+                elif self.remaining is None and self.in_flight:
+                    await self._settle()
+
+                else:
+                    break
+
+            if self.remaining:
+                self.remaining -= 1
+            self.in_flight += 1
+        finally:
+            self._lock.release()
+
+        waited = time.monotonic() - started
+        if waited > 0.001:
+            self.waits += 1
+            self.wait_time += waited
+        return self
+
+    async def __aexit__(self, *args):
+        self.in_flight -= 1
+        self._settled.set()
+
+    def update(self, headers):
+        """## Bucket.update
+        Updates the bucket from Discord's `X-RateLimit-*` response headers.
+
+        Args:
+            `headers` (`Mapping[str, str]`): Response headers.
+        """
+        if "X-RateLimit-Limit" in headers:
+            self.limit = int(headers["X-RateLimit-Limit"])
+
+        if "X-RateLimit-Remaining" in headers:
+            # Other requests in flight may not have reached Discord yet, so they
+            # still count against the bucket. Concurrent responses also arrive
+            # out of order, so within a window the lowest count wins.
+            remaining = max(int(headers["X-RateLimit-Remaining"]) - max(self.in_flight - 1, 0), 0)
+            if self.remaining is not None and time.monotonic() < self.reset_at:
+                remaining = min(remaining, self.remaining)
+            self.remaining = remaining
+
+        if "X-RateLimit-Reset-After" in headers:
+            self.reset_at = time.monotonic() + float(headers["X-RateLimit-Reset-After"])
+
+    def exhaust(self, retry_after: float):
+        """## Bucket.exhaust
+        Marks the bucket as exhausted for `retry_after` seconds after a 429.
+
+        Args:
+            `retry_after` (`float`): Seconds until the bucket can be used again.
+        """
+        self.remaining = 0
+        self.reset_at = time.monotonic() + retry_after
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "waits": self.waits,
+            "wait_time": self.wait_time
+        }
+
+class RateLimiter:
+    """## Rate Limiter
+    Tracks Discord's per-route buckets and the global rate limit for outbound
+    REST requests. Buckets are discovered from `X-RateLimit-Bucket` headers.
+
+    Interaction and webhook buckets are keyed by token, so idle buckets whose
+    limits have reset are evicted every `sweep_interval` seconds.
+    """
+    def __init__(self, sweep_interval: float = 30.0):
+        self.buckets: Dict[str, Bucket] = {}
+        self.bucket_hashes: Dict[str, str] = {}
+
+        self.global_waits = 0
+        self.global_wait_time = 0.0
+        self.ratelimited = 0
+
+        self.sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._global_reset_at = 0.0
+
+    def get_bucket(self, method: str, endpoint: str) -> Bucket:
+        """## RateLimiter.get_bucket
+        Returns the bucket a request will be queued on.
+
+        Args:
+            `method` (`str`): HTTP method of the request.
+            `endpoint` (`str`): Discord API endpoint.
+
+        Returns:
+            `Bucket`: The bucket for the route and its major parameters.
+        """
+        if time.monotonic() >= self._next_sweep:
+            self.sweep()
+
+        route, major = route_key(method, endpoint)
+        key = f"{self.bucket_hashes.get(route, route)}:{major}"
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = Bucket(key, self, major)
+        return bucket
+
+    def sweep(self) -> int:
+        """## RateLimiter.sweep
+        Evicts idle buckets whose limits have reset. An evicted bucket is
+        rediscovered the next time its route is used.
+
+        Returns:
+            `int`: The number of buckets evicted.
+        """
+        idle = [key for key, bucket in self.buckets.items() if bucket.idle]
+        for key in idle:
+            del self.buckets[key]
+        self._next_sweep = time.monotonic() + self.sweep_interval
+        return len(idle)
+
+    def update(self, bucket: Bucket, method: str, endpoint: str, headers) -> Bucket:
+        """## RateLimiter.update
+        Updates a bucket from response headers, re-keying it once Discord
+        reveals which shared bucket the route belongs to.
+
+        Args:
+            `bucket` (`Bucket`): The bucket the request was queued on.
+            `method` (`str`): HTTP method of the request.
+            `endpoint` (`str`): Discord API endpoint.
+            `headers` (`Mapping[str, str]`): Response headers.
+
+        Returns:
+            `Bucket`: The bucket for the route.
+        """
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash:
+            route, major = route_key(method, endpoint)
+            previous = self.bucket_hashes.get(route)
+            if previous != bucket_hash:
+                self.bucket_hashes[route] = bucket_hash
+                if previous is None:
+                    # Until now every major parameter of the route was keyed by
+                    # the route. They all move, so callers already queued on them
+                    # share a bucket with new callers.
+                    for other in [other for key, other in self.buckets.items() if key == f"{route}:{other.major}"]:
+                        self.rekey(other, bucket_hash)
+
+            if bucket.key != f"{bucket_hash}:{major}":
+                bucket = self.rekey(bucket, bucket_hash)
+
+        bucket.update(headers)
+        return bucket
+
+    def rekey(self, bucket: Bucket, bucket_hash: str) -> Bucket:
+        """## RateLimiter.rekey
+        Moves a bucket under the shared bucket hash Discord reported for it.
+
+        Args:
+            `bucket` (`Bucket`): The bucket to move.
+            `bucket_hash` (`str`): The `X-RateLimit-Bucket` hash.
+
+        Returns:
+            `Bucket`: The bucket now stored under the hash, an existing one if there was one.
+        """
+        if self.buckets.get(bucket.key) is bucket:
+            del self.buckets[bucket.key]
+
+        key = f"{bucket_hash}:{bucket.major}"
+        existing = self.buckets.setdefault(key, bucket)
+        if existing is bucket:
+            bucket.key = key
+        return existing
+
+    def ratelimit(self, bucket: Bucket, retry_after: float, is_global: bool = False):
+        """## RateLimiter.ratelimit
+        Records a 429 response so queued callers wait before retrying.
+
+        Args:
+            `bucket` (`Bucket`): The bucket the request was queued on.
+            `retry_after` (`float`): Seconds Discord asked us to wait.
+            `is_global` (`bool`): Whether the global rate limit was hit.
+        """
+        self.ratelimited += 1
+        if is_global:
+            self._global_reset_at = time.monotonic() + retry_after
+
+        else:
+            bucket.exhaust(retry_after)
+
+    async def wait_global(self):
+        delay = self._global_reset_at - time.monotonic()
+        if delay > 0:
+            self.global_waits += 1
+            self.global_wait_time += delay
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        """## RateLimiter.stats
+        Returns queue depth and wait time statistics for every known bucket.
+
+        Returns:
+            `dict`: Global and per-bucket statistics.
+        """
+        return {
+            "ratelimited": self.ratelimited,
+            "global_waits": self.global_waits,
+            "global_wait_time": self.global_wait_time,
+            "buckets": {
+                key: bucket.stats()
+                for key, bucket in self.buckets.items()
+            }
+        }
@@ -0,0 +1,150 @@
+import re
+
+from typing import Any, List, Optional
+
+from .codec import JSONCodec
+from .components.component import ActionRow
+
+# Placeholders such as `{user}` in a `Reply`'s text.
+PLACEHOLDER = re.compile(rb"\{(\w+)\}")
+
+_codec: Optional[JSONCodec] = None
+
+def default_codec() -> JSONCodec:
+    global _codec
+    if _codec is None:
+        _codec = JSONCodec()
+    return _codec
+
+def use_codec(codec: JSONCodec):
+    """## Use Codec
+    Sets the codec replies without one of their own are encoded with.
+    `GatewayClient` calls this with its codec, so replies follow its `json_backend`.
+
+    Args:
+        `codec` (`JSONCodec`): The codec to encode replies with.
+    """
+    global _codec
+    _codec = codec
+
+def reply_payload(
+    content: str = None,
+    components: List[ActionRow] = None,
+    embeds: list = None,
+    ephemeral: bool = False,
+    flags: int = 0
+) -> dict:
+    """## Reply Payload
+    Builds the payload of a message reply.
+
+    Raises:
+        ValueError: Neither content nor embeds provided.
+
+    Returns:
+        `dict`: Payload to send to Discord.
+    """
+    if not content and not embeds:
+        raise ValueError("You must provide a content or embeds.")
+
+    data = {
+        "flags": 64 if ephemeral and not flags else flags
+    }
+
+    if content:
+        data["content"] = content
+
+    if embeds:
+        data["embeds"] = embeds
+
+    if components:
+        data["components"] = [
+            component.to_dict()
+            for component in components
+        ]
+
+    return {
+        "type": 4,
+        "data": data
+    }
+
+class Reply:
+    __slots__ = ("payload", "body", "parts", "fields", "codec")
+
+    def __init__(
+        self,
+        content: str = None,
+        components: List[ActionRow] = None,
+        embeds: list = None,
+        ephemeral: bool = False,
+        flags: int = 0,
+        codec: Optional[JSONCodec] = None
+    ):
+        """## Reply
+        A reply declared once and encoded to bytes on first use, so returning
+        it from a handler costs no serialisation. Text may contain `{name}`
+        placeholders, filled in by `render`; only the values are encoded
+        per interaction.
+
+        Args:
+            `content` (`str`): Content of the message.
+            `components` (`List[ActionRow]`): Components of the message.
+            `embeds` (`list`): Embeds of the message.
+            `ephemeral` (`bool`): Whether the message is ephemeral.
+            `flags` (`int`): Message flags.
+            `codec` (`Optional[JSONCodec]`): Codec used to encode the reply. Defaults to the client's.
+
+        Raises:
+            ValueError: Neither content nor embeds provided.
+
+        ## Example::
+
+            WELCOME = Reply("Welcome, {name}!", ephemeral = True)
+
+            @InteractionAPI.command("welcome")
+            async def welcome(interaction):
+                return WELCOME.render(name = interaction.user.username)
+        """
+        self.codec = codec
+        self.payload = reply_payload(content, components, embeds, ephemeral, flags)
+        # Replies are usually declared at import time, before the client has
+        # picked its codec, so encoding waits for the first render.
+        self.body: Optional[bytes] = None
+        self.parts: List[Any] = []
+        self.fields = frozenset()
+
+    def _encode(self):
+        if self.codec is None:
+            self.codec = default_codec()
+        self.body = self.codec.dumps(self.payload)
+
+        # Even entries are literal bytes, odd entries are placeholder names.
+        self.parts = PLACEHOLDER.split(self.body)
+        for index in range(1, len(self.parts), 2):
+            self.parts[index] = self.parts[index].decode()
+        self.fields = frozenset(self.parts[1::2])
+
+    def render(self, **values) -> bytes:
+        """## Reply.render
+        Returns the encoded reply with its placeholders filled in.
+
+        Raises:
+            KeyError: A placeholder has no value.
+
+        Returns:
+            `bytes`: Response body to send to Discord.
+        """
+        if self.body is None:
+            self._encode()
+
+        if not self.fields:
+            return self.body
+
+        parts = self.parts.copy()
+        dumps = self.codec.dumps
+        for index in range(1, len(parts), 2):
+            # Encode the value as a JSON string and drop the quotes, it's spliced into one.
+            parts[index] = dumps(str(values[parts[index]]))[1:-1]
+        return b"".join(parts)
+
+    def to_dict(self) -> dict:
+        return self.payload
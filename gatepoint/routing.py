@@ -0,0 +1,135 @@
+import re
+
+from typing import Any, Dict, List, Optional, Tuple
+
+PARAMETER = re.compile(r"\{(\w+)(?::(\w+))?\}")
+
+CONVERTERS = {
+    "str": (r".+?", str),
+    "int": (r"-?\d+", int),
+    "float": (r"-?\d+(?:\.\d+)?", float)
+}
+
+class CustomIdTemplate:
+    def __init__(self, template: str):
+        """## Custom ID Template
+        A `custom_id` pattern with typed parameters, e.g. `vote:{poll_id:int}:{choice}`.
+        Parameters are `str` unless given a type of `int` or `float`.
+
+        Args:
+            `template` (`str`): The pattern.
+
+        Raises:
+            ValueError: Unknown parameter type provided.
+        """
+        self.template = template
+        self.converters: Dict[str, type] = {}
+
+        pattern = []
+        position = 0
+        for match in PARAMETER.finditer(template):
+            name, type_ = match.group(1), match.group(2) or "str"
+            if type_ not in CONVERTERS:
+                raise ValueError(f"custom_id: Unknown parameter type {type_!r}, must be one of {', '.join(CONVERTERS)}.")
+
+            regex, self.converters[name] = CONVERTERS[type_]
+            pattern.append(re.escape(template[position:match.start()]))
+            pattern.append(f"(?P<{name}>{regex})")
+            position = match.end()
+        pattern.append(re.escape(template[position:]))
+
+        first = PARAMETER.search(template)
+        self.prefix = template[:first.start()] if first else template
+        self.specificity = len(PARAMETER.sub("", template))
+        self.regex = re.compile("".join(pattern))
+
+    def match(self, custom_id: str) -> Optional[Dict[str, Any]]:
+        """## CustomIdTemplate.match
+        Parses a `custom_id` against the template.
+
+        Args:
+            `custom_id` (`str`): The `custom_id` sent from Discord.
+
+        Returns:
+            `Optional[Dict[str, Any]]`: The converted parameters, `None` if it doesn't match.
+        """
+        match = self.regex.fullmatch(custom_id)
+        if match is None:
+            return None
+
+        return {
+            name: self.converters[name](value)
+            for name, value in match.groupdict().items()
+        }
+
+    def format(self, **parameters) -> str:
+        """## CustomIdTemplate.format
+        Builds a `custom_id` from the template.
+
+        Returns:
+            `str`: The `custom_id`.
+        """
+        return PARAMETER.sub(lambda match: str(parameters[match.group(1)]), self.template)
+
+class CustomIdRouter:
+    def __init__(self):
+        """## Custom ID Router
+        Matches `custom_id`s against templates. Templates are stored in a
+        prefix trie keyed by the literal text before their first parameter,
+        so only templates sharing the `custom_id`'s prefix are tried, longest
+        prefix and then most literal text first.
+        """
+        self.root: dict = {}
+        self.templates: List[CustomIdTemplate] = []
+
+    def add(self, template: str, value: Any) -> CustomIdTemplate:
+        """## CustomIdRouter.add
+        Adds a template.
+
+        Args:
+            `template` (`str`): The `custom_id` pattern.
+            `value` (`Any`): Returned when a `custom_id` matches the template.
+
+        Returns:
+            `CustomIdTemplate`: The parsed template.
+        """
+        parsed = CustomIdTemplate(template)
+        node = self.root
+        for character in parsed.prefix:
+            node = node.setdefault(character, {})
+        routes = node.setdefault(None, [])
+        routes.append((parsed, value))
+        # Templates with more literal text are more specific and tried first.
+        routes.sort(key = lambda route: -route[0].specificity)
+        self.templates.append(parsed)
+        return parsed
+
+    def match(self, custom_id: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """## CustomIdRouter.match
+        Finds the template a `custom_id` matches.
+
+        Args:
+            `custom_id` (`str`): The `custom_id` sent from Discord.
+
+        Returns:
+            `Optional[Tuple[Any, Dict[str, Any]]]`: The template's value and parsed parameters.
+        """
+        candidates = []
+        node = self.root
+        if None in node:
+            candidates.append(node[None])
+
+        for character in custom_id:
+            node = node.get(character)
+            if node is None:
+                break
+
+            if None in node:
+                candidates.append(node[None])
+
+        for routes in reversed(candidates):
+            for template, value in routes:
+                parameters = template.match(custom_id)
+                if parameters is not None:
+                    return value, parameters
+        return None
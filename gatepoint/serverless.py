@@ -0,0 +1,138 @@
+import asyncio
+import base64
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from .dispatch import Dispatcher
+
+if TYPE_CHECKING:
+    from .gateway import GatewayClient
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+class ServerlessHandler:
+    def __init__(self, client: "GatewayClient", drain: bool = True):
+        """## Serverless Handler
+        Serves a client's interactions from a function platform without
+        starting a server. Each call takes a raw HTTP event and returns its
+        status, headers and body. One event loop is created per process and
+        reused by every warm invocation, along with the client's HTTP session.
+
+        Events may be API Gateway, Lambda function URL or similar dicts with
+        `headers`, `body` and optionally `isBase64Encoded`, and the response
+        is returned in the same shape: `statusCode`, `headers` and `body`.
+
+        A cold start only compiles the dispatch table and fires `startup`
+        events. The bot isn't fetched and commands aren't synced; use
+        `GatewayClient.sync_commands` from a deploy step instead. Deferred
+        responses are only delivered if the platform keeps running the process
+        after a response is returned, so handlers should reply within the
+        client's `defer_after`.
+
+        Args:
+            `client` (`GatewayClient`): The client whose interactions are served.
+            `drain` (`bool`): Finish background tasks and listeners before returning, as the platform may freeze the process afterwards. Defaults to `True`.
+
+        ## Example::
+
+            handler = InteractionAPI.serverless_handler()
+
+            def lambda_handler(event, context):
+                return handler(event, context)
+        """
+        self.client = client
+        self.drain = drain
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.started = False
+
+        self.invocations = 0
+        self.cold_starts = 0
+
+    def __call__(self, event: Dict[str, Any], context: Any = None) -> Dict[str, Any]:
+        if self.loop is None or self.loop.is_closed():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+        return self.loop.run_until_complete(self.handle(event))
+
+    async def start(self):
+        """## ServerlessHandler.start
+        Compiles the client's dispatch table and fires `startup` events.
+        This is called for you on the first invocation.
+        """
+        self.cold_starts += 1
+        if self.client.dispatcher is None:
+            self.client.dispatcher = Dispatcher(self.client)
+        for event in self.client.events.get("startup") or []:
+            event: Callable
+            await event()
+        self.started = True
+
+    async def handle(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """## ServerlessHandler.handle
+        Verifies, dispatches and encodes one HTTP event.
+
+        Args:
+            `event` (`Dict[str, Any]`): The raw HTTP event.
+
+        Returns:
+            `Dict[str, Any]`: The `statusCode`, `headers` and `body` of the response.
+        """
+        if not self.started:
+            await self.start()
+        self.invocations += 1
+
+        method, headers, body = parse_event(event)
+        if method == "GET":
+            status, content = 200, b'"This is a Discord Interaction API."'
+
+        elif method != "POST":
+            status, content = 405, b'{"detail":"Method Not Allowed"}'
+
+        else:
+            status, content = await self.client.process(
+                headers.get("x-signature-ed25519"),
+                headers.get("x-signature-timestamp"),
+                body
+            )
+
+        if self.drain:
+            # Deferred responses aren't waited for, they edit a response Discord
+            # only has once this one is returned.
+            for queue in (self.client.tasks, self.client.listener_queue):
+                await queue.drain(self.client.drain_timeout)
+
+        return {
+            "statusCode": status,
+            "headers": JSON_HEADERS,
+            "body": content.decode()
+        }
+
+    def close(self):
+        """## ServerlessHandler.close
+        Shuts the client down and closes the event loop.
+        """
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.run_until_complete(self.client.shutdown())
+            self.loop.close()
+        self.started = False
+
+def parse_event(event: Dict[str, Any]) -> Tuple[str, Dict[str, str], bytes]:
+    """## Parse Event
+    Reads the method, headers and body of a raw HTTP event.
+
+    Args:
+        `event` (`Dict[str, Any]`): The raw HTTP event.
+
+    Returns:
+        `Tuple[str, Dict[str, str], bytes]`: The method, lowercased headers and body.
+    """
+    method = event.get("httpMethod") or ((event.get("requestContext") or {}).get("http") or {}).get("method") or "POST"
+    headers = {
+        name.lower(): value
+        for name, value in (event.get("headers") or {}).items()
+    }
+
+    body = event.get("body") or b""
+    if isinstance(body, str):
+        body = base64.b64decode(body) if event.get("isBase64Encoded") else body.encode()
+    return method.upper(), headers, body
@@ -0,0 +1,351 @@
+import asyncio
+import hashlib
+import itertools
+import json
+import random
+import time
+
+from collections import Counter, deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from .ratelimit import route_key
+
+# Routes outside the bot's global rate limit, as on Discord.
+GLOBAL_EXEMPT = ("/interactions/", "/webhooks/")
+
+class DiscordStandIn:
+    def __init__(
+        self,
+        application_id: str = "1000000000000000000",
+        username: str = "GatePoint",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bucket_limit: int = 5,
+        bucket_window: float = 1.0,
+        global_limit: Optional[int] = 50,
+        history_size: int = 1000
+    ):
+        """## Discord Stand-In
+        Local, in-memory stand-in for the Discord REST API, for load testing
+        follow-ups, command registration and rate limiting offline. It serves
+        `users/@me`, application commands, interaction callbacks, webhooks,
+        messages and channels, sends Discord's rate-limit headers, answers
+        with 429s once a bucket or the global limit is used up, and can add
+        latency to every response.
+
+        Args:
+            `application_id` (`str`): ID of the bot and its application. Defaults to `"1000000000000000000"`.
+            `username` (`str`): Username of the bot. Defaults to `"GatePoint"`.
+            `latency` (`float`): Seconds added to every response. Defaults to `0.0`.
+            `jitter` (`float`): Up to this many random seconds added on top of `latency`. Defaults to `0.0`.
+            `bucket_limit` (`int`): Requests allowed per bucket each window. Defaults to `5`.
+            `bucket_window` (`float`): Seconds until a bucket resets. Defaults to `1.0`.
+            `global_limit` (`Optional[int]`): Requests allowed per second across all buckets, `None` to disable. Defaults to `50`.
+            `history_size` (`int`): Number of recent requests kept in `history`. Defaults to `1000`.
+
+        ## Example::
+
+            async with DiscordStandIn(latency = 0.05) as discord:
+                client = GatewayClient(..., api_base = discord.api_base)
+                await client.fetch_bot()
+        """
+        self.application_id = application_id
+        self.username = username
+        self.latency = latency
+        self.jitter = jitter
+        self.bucket_limit = bucket_limit
+        self.bucket_window = bucket_window
+        self.global_limit = global_limit
+
+        self.commands: Dict[str, List[dict]] = {}
+        self.messages: Dict[str, dict] = {}
+        self.channels: Dict[str, dict] = {}
+        # `@original` message of each interaction token.
+        self.originals: Dict[str, str] = {}
+
+        self.requests: Counter = Counter()
+        self.ratelimited: Counter = Counter()
+        self.history: deque = deque(maxlen = history_size)
+
+        self.api_base: Optional[str] = None
+        self._buckets: Dict[str, Tuple[int, float]] = {}
+        self._global: Tuple[int, float] = (0, 0.0)
+        self._ids = itertools.count(int(time.time() * 1000 - 1420070400000) << 22)
+        self._runner: Optional[web.AppRunner] = None
+
+        self.routes: Dict[str, Callable[..., Awaitable[Tuple[int, Any]]]] = {
+            "GET /users/@me": self.get_me,
+            "GET /applications/{id}/commands": self.get_commands,
+            "PUT /applications/{id}/commands": self.put_commands,
+            "POST /applications/{id}/commands": self.post_command,
+            "DELETE /applications/{id}/commands/{id}": self.delete_command,
+            "GET /applications/{id}/guilds/{guilds}/commands": self.get_commands,
+            "PUT /applications/{id}/guilds/{guilds}/commands": self.put_commands,
+            "POST /applications/{id}/guilds/{guilds}/commands": self.post_command,
+            "DELETE /applications/{id}/guilds/{guilds}/commands/{id}": self.delete_command,
+            "POST /interactions/{interactions}/{token}/callback": self.callback,
+            "POST /webhooks/{webhooks}/{token}": self.post_webhook,
+            "GET /webhooks/{webhooks}/{token}/messages/@original": self.get_message,
+            "PATCH /webhooks/{webhooks}/{token}/messages/@original": self.patch_message,
+            "DELETE /webhooks/{webhooks}/{token}/messages/@original": self.delete_message,
+            "GET /webhooks/{webhooks}/{token}/messages/{id}": self.get_message,
+            "PATCH /webhooks/{webhooks}/{token}/messages/{id}": self.patch_message,
+            "DELETE /webhooks/{webhooks}/{token}/messages/{id}": self.delete_message,
+            "GET /channels/{channels}": self.get_channel,
+            "POST /channels/{channels}/messages": self.post_message,
+            "GET /channels/{channels}/messages/{id}": self.get_message,
+            "PATCH /channels/{channels}/messages/{id}": self.patch_message,
+            "DELETE /channels/{channels}/messages/{id}": self.delete_message
+        }
+
+    async def __aenter__(self) -> "DiscordStandIn":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """## DiscordStandIn.start
+        Starts serving on the running event loop.
+
+        Args:
+            `host` (`str`): Address to listen on. Defaults to `"127.0.0.1"`.
+            `port` (`int`): Port to listen on, `0` for any free port. Defaults to `0`.
+
+        Returns:
+            `str`: The `api_base` to give `GatewayClient`.
+        """
+        app = web.Application()
+        app.router.add_route("*", r"/api/v{version:\d+}/{endpoint:.*}", self.handle)
+        self._runner = web.AppRunner(app, access_log = None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        host, port = self._runner.addresses[0][:2]
+        self.api_base = f"http://{host}:{port}/api"
+        return self.api_base
+
+    async def stop(self):
+        """## DiscordStandIn.stop
+        Stops serving.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def snowflake(self) -> str:
+        return str(next(self._ids))
+
+    def stats(self) -> dict:
+        """## DiscordStandIn.stats
+        Returns request and 429 counts by route.
+
+        Returns:
+            `dict`: Request statistics.
+        """
+        return {
+            "requests": dict(self.requests),
+            "ratelimited": dict(self.ratelimited),
+            "total": sum(self.requests.values()),
+            "total_ratelimited": sum(self.ratelimited.values())
+        }
+
+    async def handle(self, request: web.Request) -> web.Response:
+        endpoint = "/" + request.match_info["endpoint"]
+        route, major = route_key(request.method, endpoint)
+        body = json.loads(await request.read() or b"null")
+        self.requests[route] += 1
+        self.history.append((request.method, endpoint, body))
+
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+        handler = self.routes.get(route)
+        if handler is None:
+            return web.json_response({"message": "404: Not Found", "code": 0}, status = 404)
+
+        if not endpoint.startswith(GLOBAL_EXEMPT):
+            if not request.headers.get("Authorization", "").startswith("Bot "):
+                return web.json_response({"message": "401: Unauthorized", "code": 0}, status = 401)
+
+            limited = self.check_global()
+            if limited is not None:
+                self.ratelimited[route] += 1
+                return limited
+
+        headers, limited = self.check_bucket(route, major)
+        if limited:
+            self.ratelimited[route] += 1
+            return web.json_response({
+                "message": "You are being rate limited.",
+                "retry_after": float(headers["X-RateLimit-Reset-After"]),
+                "global": False
+            }, status = 429, headers = {**headers, "Retry-After": headers["X-RateLimit-Reset-After"], "X-RateLimit-Scope": "user"})
+
+        status, data = await handler(endpoint.strip("/").split("/"), body)
+        if status == 204:
+            return web.Response(status = 204, headers = headers)
+        return web.json_response(data, status = status, headers = headers)
+
+    def check_global(self) -> Optional[web.Response]:
+        if self.global_limit is None:
+            return None
+
+        now = time.time()
+        count, reset_at = self._global
+        if now >= reset_at:
+            count, reset_at = 0, now + 1.0
+
+        if count >= self.global_limit:
+            retry_after = f"{reset_at - now:.3f}"
+            return web.json_response({
+                "message": "You are being rate limited.",
+                "retry_after": float(retry_after),
+                "global": True
+            }, status = 429, headers = {"Retry-After": retry_after, "X-RateLimit-Global": "true", "X-RateLimit-Scope": "global"})
+
+        self._global = (count + 1, reset_at)
+        return None
+
+    def check_bucket(self, route: str, major: str) -> Tuple[Dict[str, str], bool]:
+        now = time.time()
+        key = f"{route}:{major}"
+        used, reset_at = self._buckets.get(key, (0, 0.0))
+        if now >= reset_at:
+            used, reset_at = 0, now + self.bucket_window
+
+        limited = used >= self.bucket_limit
+        if not limited:
+            used += 1
+            self._buckets[key] = (used, reset_at)
+
+        return {
+            "X-RateLimit-Limit": str(self.bucket_limit),
+            "X-RateLimit-Remaining": str(self.bucket_limit - used),
+            "X-RateLimit-Reset": f"{reset_at:.3f}",
+            "X-RateLimit-Reset-After": f"{reset_at - now:.3f}",
+            "X-RateLimit-Bucket": hashlib.sha1(route.encode()).hexdigest()[:32]
+        }, limited
+
+    def message(self, channel_id: str, data: dict, message_id: str = None) -> dict:
+        message = {
+            "id": message_id or self.snowflake(),
+            "channel_id": channel_id,
+            "type": 0,
+            "content": "",
+            "embeds": [],
+            "components": [],
+            "attachments": [],
+            "author": self.user(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
+            "edited_timestamp": None
+        }
+        message.update(data or {})
+        self.messages[message["id"]] = message
+        return message
+
+    def user(self) -> dict:
+        return {
+            "id": self.application_id,
+            "username": self.username,
+            "discriminator": "0",
+            "avatar": None,
+            "bot": True
+        }
+
+    async def get_me(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        return 200, self.user()
+
+    @staticmethod
+    def command_scope(segments: List[str]) -> str:
+        # /applications/{id}/guilds/{guild}/commands is guild scoped.
+        return segments[3] if segments[2] == "guilds" else "global"
+
+    def command(self, data: dict, scope: str) -> dict:
+        command = {
+            "id": self.snowflake(),
+            "application_id": self.application_id,
+            "version": self.snowflake(),
+            "type": 1,
+            **data
+        }
+        if scope != "global":
+            command["guild_id"] = scope
+        return command
+
+    async def get_commands(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        return 200, self.commands.get(self.command_scope(segments), [])
+
+    async def put_commands(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        scope = self.command_scope(segments)
+        self.commands[scope] = [self.command(data, scope) for data in body or []]
+        return 200, self.commands[scope]
+
+    async def post_command(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        scope = self.command_scope(segments)
+        commands = [command for command in self.commands.get(scope, []) if command["name"] != body["name"]]
+        command = self.command(body, scope)
+        self.commands[scope] = commands + [command]
+        return 201, command
+
+    async def delete_command(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        scope = self.command_scope(segments)
+        self.commands[scope] = [command for command in self.commands.get(scope, []) if command["id"] != segments[-1]]
+        return 204, None
+
+    async def callback(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        token = segments[2]
+        if (body or {}).get("type") in (4, 5, 7):
+            self.originals[token] = self.message("0", (body or {}).get("data"))["id"]
+        return 204, None
+
+    def message_id(self, segments: List[str]) -> Optional[str]:
+        if segments[-1] == "@original":
+            return self.originals.get(segments[2])
+        return segments[-1]
+
+    async def post_webhook(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        return 200, self.message("0", body)
+
+    async def get_message(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        message = self.messages.get(self.message_id(segments))
+        if message is None:
+            return 404, {"message": "Unknown Message", "code": 10008}
+        return 200, message
+
+    async def patch_message(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        message_id = self.message_id(segments)
+        if message_id is None and segments[-1] == "@original":
+            # Editing the deferred response of an interaction the stand-in never saw.
+            self.originals[segments[2]] = message_id = self.message("0", {})["id"]
+
+        message = self.messages.get(message_id)
+        if message is None:
+            return 404, {"message": "Unknown Message", "code": 10008}
+
+        message.update(body or {})
+        message["edited_timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+        return 200, message
+
+    async def delete_message(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        if self.messages.pop(self.message_id(segments), None) is None:
+            return 404, {"message": "Unknown Message", "code": 10008}
+        return 204, None
+
+    async def get_channel(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        channel_id = segments[1]
+        channel = self.channels.setdefault(channel_id, {
+            "id": channel_id,
+            "type": 0,
+            "name": f"channel-{channel_id[-4:]}",
+            "position": 0,
+            "nsfw": False
+        })
+        return 200, channel
+
+    async def post_message(self, segments: List[str], body: Any) -> Tuple[int, Any]:
+        return 200, self.message(segments[1], body)
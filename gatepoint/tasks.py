@@ -0,0 +1,152 @@
+import asyncio
+
+from typing import Callable, List, Optional
+
+from .utils import output
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+class TaskQueue:
+    def __init__(
+        self,
+        workers: int = 4,
+        maxsize: int = 1000,
+        overflow: str = "drop_oldest",
+        name: str = "task"
+    ):
+        """## Task Queue
+        Bounded queue of coroutine functions run by a fixed pool of workers,
+        keeping their cost off the interaction's response path. A failing
+        task is logged and never affects other tasks or the caller. With the
+        `"block"` overflow policy, callers wait for room in the queue.
+
+        Args:
+            `workers` (`int`): Number of tasks run at once. Defaults to `4`.
+            `maxsize` (`int`): Maximum number of queued tasks. Defaults to `1000`.
+            `overflow` (`str`): What to do when the queue is full: `"drop_oldest"`, `"drop_newest"` or `"block"`. Defaults to `"drop_oldest"`.
+            `name` (`str`): Name used in log messages. Defaults to `"task"`.
+
+        Raises:
+            ValueError: Unknown overflow policy provided.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow: Must be one of {', '.join(OVERFLOW_POLICIES)}.")
+
+        self.workers = workers
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.name = name
+
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.running = 0
+
+        self.queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def start(self):
+        """## TaskQueue.start
+        Starts the workers on the running event loop.
+        """
+        if self._workers:
+            return
+
+        self.queue = asyncio.Queue(maxsize = self.maxsize)
+        self._workers = [
+            asyncio.ensure_future(self.worker())
+            for _ in range(self.workers)
+        ]
+
+    async def put(self, func: Callable, *args) -> bool:
+        """## TaskQueue.put
+        Queues `func(*args)` to run in the background.
+
+        Args:
+            `func` (`Callable`): Coroutine function to run.
+            `*args`: Arguments passed to `func`.
+
+        Returns:
+            `bool`: Whether the task was queued, `False` if it was dropped.
+        """
+        self.start()
+        self.submitted += 1
+        try:
+            self.queue.put_nowait((func, args))
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow == "block":
+            await self.queue.put((func, args))
+            return True
+
+        self.dropped += 1
+        if self.overflow == "drop_newest":
+            return False
+
+        self.queue.get_nowait()
+        self.queue.task_done()
+        self.queue.put_nowait((func, args))
+        return True
+
+    async def worker(self):
+        while True:
+            func, args = await self.queue.get()
+            self.running += 1
+            try:
+                await func(*args)
+                self.completed += 1
+            except Exception as error:
+                self.failed += 1
+                output(f"Background {self.name} {getattr(func, '__name__', func)!s} failed: {error!r}", "ERROR")
+            finally:
+                self.running -= 1
+                self.queue.task_done()
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """## TaskQueue.drain
+        Waits for every queued and running task to finish.
+
+        Args:
+            `timeout` (`Optional[float]`): Seconds to wait, `None` to wait forever. Defaults to `None`.
+
+        Returns:
+            `bool`: Whether every task finished before the timeout.
+        """
+        if self.queue is None:
+            return True
+
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            output(f"Abandoned {self.queue.qsize() + self.running} background {self.name}s on shutdown.", "WARNING")
+            return False
+
+    def stats(self) -> dict:
+        """## TaskQueue.stats
+        Returns counts of submitted, completed, failed, dropped, queued and running tasks.
+
+        Returns:
+            `dict`: Task statistics.
+        """
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+            "running": self.running
+        }
+
+    async def stop(self):
+        """## TaskQueue.stop
+        Cancels the workers, dropping any queued tasks.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions = True)
+        self._workers = []
+        self.queue = None
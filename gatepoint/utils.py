@@ -0,0 +1,8 @@
+def output(content, type_ = None):
+    if type_ == "ERROR":
+        return print(f"ERR: {content}")
+
+    elif type_ == "WARNING":
+        return print(f"WARN: {content}")
+
+    return print(f"INFO: {content}")
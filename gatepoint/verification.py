@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+from concurrent.futures import Executor
+from typing import Optional
+
+from nacl.signing import VerifyKey
+from nacl.exceptions import BadSignatureError
+
+class Verifier:
+    def __init__(
+        self,
+        public_key: str,
+        timestamp_window: Optional[float] = 300,
+        executor: Optional[Executor] = None
+    ):
+        """## Verifier
+        Verifies the Ed25519 signature Discord attaches to every interaction.
+        The verify key is built once, and requests with a stale or skewed
+        `X-Signature-Timestamp` are rejected before any crypto is done.
+
+        Args:
+            `public_key` (`str`): The Discord Application's Public Key.
+            `timestamp_window` (`Optional[float]`): Seconds a timestamp may differ from the local clock, `None` to disable. Defaults to `300`.
+            `executor` (`Optional[Executor]`): Executor to offload signature checks to. Defaults to `None`.
+
+        Raises:
+            ValueError: Invalid public key provided.
+        """
+        self.verify_key = VerifyKey(bytes.fromhex(public_key))
+        self.timestamp_window = timestamp_window
+        self.executor = executor
+
+        self.verified = 0
+        self.rejected = 0
+        self.stale = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+
+    def check_timestamp(self, timestamp: str) -> bool:
+        """## Verifier.check_timestamp
+        Checks that a signature timestamp is within the configured window.
+
+        Args:
+            `timestamp` (`str`): Value of the `X-Signature-Timestamp` header.
+
+        Returns:
+            `bool`: Whether the timestamp is acceptable.
+        """
+        if self.timestamp_window is None:
+            return True
+
+        try:
+            return abs(time.time() - int(timestamp)) <= self.timestamp_window
+        except ValueError:
+            return False
+
+    def verify(self, signature: str, timestamp: str, body: bytes) -> bool:
+        """## Verifier.verify
+        Verifies a request's signature.
+
+        Args:
+            `signature` (`str`): Value of the `X-Signature-Ed25519` header.
+            `timestamp` (`str`): Value of the `X-Signature-Timestamp` header.
+            `body` (`bytes`): Raw request body.
+
+        Returns:
+            `bool`: Whether the request was signed by Discord.
+        """
+        started = time.perf_counter()
+        valid = False
+        if not self.check_timestamp(timestamp):
+            self.stale += 1
+
+        else:
+            try:
+                self.verify_key.verify(timestamp.encode() + body, bytes.fromhex(signature))
+                valid = True
+            except (BadSignatureError, ValueError):
+                pass
+
+        if valid:
+            self.verified += 1
+
+        else:
+            self.rejected += 1
+
+        self.last_time = time.perf_counter() - started
+        self.total_time += self.last_time
+        return valid
+
+    async def verify_async(self, signature: str, timestamp: str, body: bytes) -> bool:
+        """## Verifier.verify_async
+        Verifies a request's signature, in the executor when one is configured.
+
+        Args:
+            `signature` (`str`): Value of the `X-Signature-Ed25519` header.
+            `timestamp` (`str`): Value of the `X-Signature-Timestamp` header.
+            `body` (`bytes`): Raw request body.
+
+        Returns:
+            `bool`: Whether the request was signed by Discord.
+        """
+        if self.executor is None:
+            return self.verify(signature, timestamp, body)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.verify, signature, timestamp, body
+        )
+
+    def stats(self) -> dict:
+        """## Verifier.stats
+        Returns verification counts and latency.
+
+        Returns:
+            `dict`: Verification statistics, latencies are in seconds.
+        """
+        total = self.verified + self.rejected
+        return {
+            "verified": self.verified,
+            "rejected": self.rejected,
+            "stale": self.stale,
+            "last_time": self.last_time,
+            "mean_time": self.total_time / total if total else 0.0
+        }
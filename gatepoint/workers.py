@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+from typing import Dict, List
+
+import uvicorn
+
+from .gateway import GatewayClient
+from .utils import output
+
+def listening_socket(config: uvicorn.Config) -> socket.socket:
+    """Binds the listening socket of a config. TCP sockets are created with
+    an explicit protocol, asyncio only sets TCP_NODELAY on accepted sockets
+    when it is, and without it every response waits on a delayed ACK."""
+    if config.fd is not None:
+        # Family, type and protocol are read from the descriptor.
+        return socket.socket(fileno = config.fd)
+
+    sock = config.bind_socket()
+    if sock.family in (socket.AF_INET, socket.AF_INET6):
+        return socket.socket(sock.family, sock.type, socket.IPPROTO_TCP, fileno = sock.detach())
+    return sock
+
+def serve_worker(client: GatewayClient, config: uvicorn.Config, sock: socket.socket, worker_id: int, primary: bool):
+    client.worker_id = worker_id
+    client.primary = primary
+    uvicorn.Server(config).run(sockets = [sock])
+
+class Supervisor:
+    def __init__(
+        self,
+        client: GatewayClient,
+        config: uvicorn.Config,
+        workers: int,
+        restart_delay: float = 1.0
+    ):
+        """## Supervisor
+        Runs a client in several worker processes that share one listening
+        socket, restarting any worker that crashes. Only the first worker
+        to start is primary and runs once-only work such as command sync.
+
+        Args:
+            `client` (`GatewayClient`): The client to serve.
+            `config` (`uvicorn.Config`): Server configuration shared by every worker.
+            `workers` (`int`): Number of worker processes.
+            `restart_delay` (`float`): Seconds to wait before restarting a crashed worker. Defaults to `1.0`.
+        """
+        self.client = client
+        self.config = config
+        self.workers = workers
+        self.restart_delay = restart_delay
+
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self.restarts: List[float] = []
+        self.should_exit = False
+        self._context = multiprocessing.get_context("fork")
+
+    def spawn(self, sock: socket.socket, worker_id: int, primary: bool = False):
+        process = self._context.Process(
+            target = serve_worker,
+            args = (self.client, self.config, sock, worker_id, primary),
+            name = f"gatepoint-worker-{worker_id}"
+        )
+        process.start()
+        self.processes[worker_id] = process
+
+    def handle_exit(self, signum, frame):
+        self.should_exit = True
+
+    def run(self):
+        """## Supervisor.run
+        Binds the listening socket, starts every worker and supervises them
+        until interrupted.
+        """
+        sock = listening_socket(self.config)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self.handle_exit)
+
+        for worker_id in range(self.workers):
+            self.spawn(sock, worker_id, primary = worker_id == 0)
+        output(f"Started {self.workers} workers in supervisor process {os.getpid()}.")
+
+        try:
+            while not self.should_exit:
+                time.sleep(0.5)
+                for worker_id, process in list(self.processes.items()):
+                    if process.is_alive() or self.should_exit:
+                        continue
+
+                    output(f"Worker {worker_id} exited with code {process.exitcode}, restarting.", "WARNING")
+                    # Back off when workers keep crashing so a broken handler can't spin the CPU.
+                    now = time.monotonic()
+                    self.restarts = [at for at in self.restarts if now - at < 60] + [now]
+                    time.sleep(min(self.restart_delay * len(self.restarts), 30))
+                    self.spawn(sock, worker_id)
+        finally:
+            for process in self.processes.values():
+                if process.is_alive():
+                    process.terminate()
+
+            for process in self.processes.values():
+                process.join(timeout = 10)
+            sock.close()
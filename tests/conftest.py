@@ -0,0 +1,17 @@
+import pytest
+
+from gatepoint import GatewayClient
+
+@pytest.fixture
+def make_client():
+    """Builds clients that never touch the disk, with any arguments overridden."""
+    def make(**overrides) -> GatewayClient:
+        return GatewayClient(**{
+            "secret_key": "secret",
+            "public_key": "00" * 32,
+            "token": "token",
+            "identity_cache_path": None,
+            "manifest_path": None,
+            **overrides
+        })
+    return make
@@ -0,0 +1,18 @@
+from gatepoint import ChoiceIndex
+
+CITIES = [f"{prefix} {root} {index}" for index, (prefix, root) in enumerate(
+    (prefix, root)
+    for prefix in ("North", "South", "East", "West")
+    for root in ("London", "York", "Haven", "Field")
+    for _ in range(200)
+)]
+
+def test_fuzzy_finds_the_closest_choices():
+    cities = ChoiceIndex(CITIES + ["Londonderry"], max_postings = 64)
+    names = [cities.choices[index]["name"] for index in cities.fuzzy("nrth londn", 5)]
+    assert all(name.startswith("North London") for name in names)
+    assert cities.choices[cities.fuzzy("londondery", 1)[0]]["name"] == "Londonderry"
+
+def test_search_puts_prefix_matches_first():
+    cities = ChoiceIndex(CITIES)
+    assert [choice["name"] for choice in cities.search("york 20", 2)] == ["North York 200", "North York 201"]
@@ -0,0 +1,26 @@
+from gatepoint.binding import Binder
+
+class FakeInteraction:
+    resolved = None
+
+def test_dashed_option_names_bind_to_underscored_parameters():
+    async def handler(interaction, user_id: int = 0, reason: str = None):
+        pass
+
+    options = [
+        {"type": 4, "name": "user-id", "value": 42},
+        {"type": 3, "name": "reason", "value": "spam"}
+    ]
+    assert Binder(handler)(FakeInteraction(), options) == {"user_id": 42, "reason": "spam"}
+
+def test_missing_options_take_defaults_and_unknown_options_are_dropped():
+    async def handler(interaction, days: int = 7, member = None):
+        pass
+
+    assert Binder(handler)(FakeInteraction(), [{"type": 3, "name": "other", "value": "x"}]) == {"days": 7, "member": None}
+
+def test_kwargs_handlers_receive_every_option():
+    async def handler(interaction, **options):
+        pass
+
+    assert Binder(handler)(FakeInteraction(), [{"type": 5, "name": "dry-run", "value": True}]) == {"dry_run": True}
@@ -0,0 +1,93 @@
+import asyncio
+
+from gatepoint import GatewayClient, OptionType
+from gatepoint.gateway import Bot
+
+def option_names(client: GatewayClient, command: str) -> list:
+    return [option["name"] for option in client.interactions[command].register_json["options"]]
+
+def test_options_above_command_keep_source_order(make_client):
+    client = make_client()
+
+    @client.add_option(OptionType.STRING, "text", "Text to echo.", required = True)
+    @client.add_option(OptionType.INTEGER, "times", "Times to echo it.")
+    @client.add_option(OptionType.USER, "target", "Who to echo it to.")
+    @client.command("echo", description = "Echoes text.")
+    async def echo(interaction, text, times = 1, target = None):
+        pass
+
+    assert option_names(client, "echo") == ["text", "times", "target"]
+
+def test_options_below_command_keep_source_order(make_client):
+    client = make_client()
+
+    @client.command("echo", description = "Echoes text.")
+    @client.add_option(OptionType.STRING, "text", "Text to echo.", required = True)
+    @client.add_option(OptionType.INTEGER, "times", "Times to echo it.")
+    @client.add_option(OptionType.USER, "target", "Who to echo it to.")
+    async def echo(interaction, text, times = 1, target = None):
+        pass
+
+    assert option_names(client, "echo") == ["text", "times", "target"]
+
+def test_options_around_command_follow_explicit_options(make_client):
+    client = make_client()
+    explicit = {"type": OptionType.BOOLEAN, "name": "loud", "description": "Shout it."}
+
+    @client.add_option(OptionType.STRING, "text", "Text to echo.", required = True)
+    @client.command("echo", description = "Echoes text.", options = [explicit])
+    @client.add_option(OptionType.INTEGER, "times", "Times to echo it.")
+    async def echo(interaction, text, loud = False, times = 1):
+        pass
+
+    assert option_names(client, "echo") == ["loud", "text", "times"]
+
+def test_subcommand_options_keep_source_order(make_client):
+    client = make_client()
+
+    @client.add_option(OptionType.USER, "member", "Member to ban.", required = True)
+    @client.add_option(OptionType.INTEGER, "days", "Days of messages to delete.")
+    @client.subcommand("ban", parent = "mod")
+    async def ban(interaction, member, days = 0):
+        pass
+
+    subcommand = client.interactions["mod"].child("ban")
+    assert [option.name for option in subcommand.options] == ["member", "days"]
+
+def sync(client: GatewayClient) -> list:
+    calls = []
+
+    async def request(method, endpoint, json = None):
+        calls.append((method, endpoint, json))
+        return []
+
+    client.bot = Bot({"id": "1", "avatar": None, "username": "bot", "discriminator": "0"})
+    client.request = request
+    asyncio.run(client.sync_commands())
+    return calls
+
+def test_guild_only_commands_leave_global_commands_alone(make_client, tmp_path):
+    client = make_client(manifest_path = str(tmp_path / "manifest.json"))
+
+    @client.command("ping", description = "Pong!", guild_ids = [2])
+    async def ping(interaction):
+        pass
+
+    calls = sync(client)
+    assert [(method, endpoint) for method, endpoint, _ in calls] == [
+        ("PUT", "/applications/1/guilds/2/commands")
+    ]
+
+def test_global_commands_are_cleared_once_removed(make_client, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    client = make_client(manifest_path = manifest_path)
+
+    @client.command("ping", description = "Pong!")
+    async def ping(interaction):
+        pass
+
+    assert [endpoint for _, endpoint, _ in sync(client)] == ["/applications/1/commands"]
+
+    client = make_client(manifest_path = manifest_path)
+    assert sync(client) == [("PUT", "/applications/1/commands", [])]
+    assert sync(client) == []
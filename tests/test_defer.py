@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+from gatepoint import DiscordStandIn, Embed
+
+def command(name: str) -> dict:
+    return {"type": 2, "data": {"name": name}}
+
+def test_components_defer_as_message_updates(make_client):
+    client = make_client(defer_ephemeral = True)
+    assert client.deferral({"type": 3, "data": {"custom_id": "vote", "component_type": 2}}) == {"type": 6}
+
+def test_commands_follow_the_client_default(make_client):
+    assert make_client().deferral(command("ping")) == {"type": 5}
+    assert make_client(defer_ephemeral = True).deferral(command("ping")) == {"type": 5, "data": {"flags": 64}}
+
+def test_handlers_override_the_client_default(make_client):
+    client = make_client()
+
+    @client.command("secret", defer_ephemeral = True)
+    async def secret(interaction):
+        pass
+
+    @client.subcommand("ban", parent = "mod", group = "user", defer_ephemeral = True)
+    async def ban(interaction):
+        pass
+
+    @client.modal("feedback", defer_ephemeral = True)
+    async def feedback(interaction, values):
+        pass
+
+    subcommand = {
+        "type": 2,
+        "data": {
+            "name": "mod",
+            "options": [{"type": 2, "name": "user", "options": [{"type": 1, "name": "ban", "options": []}]}]
+        }
+    }
+    assert client.deferral(command("secret")) == {"type": 5, "data": {"flags": 64}}
+    assert client.deferral(subcommand) == {"type": 5, "data": {"flags": 64}}
+    assert client.deferral({"type": 5, "data": {"custom_id": "feedback"}}) == {"type": 5, "data": {"flags": 64}}
+    assert client.deferral(command("public")) == {"type": 5}
+
+def test_deferred_embeds_are_delivered(make_client):
+    async def run():
+        async with DiscordStandIn() as discord:
+            client = make_client(api_base = discord.api_base, defer_after = 0.1)
+
+            @client.command("slow")
+            async def slow(interaction):
+                await asyncio.sleep(0.3)
+                return interaction.reply(embeds = [Embed(title = "hi")])
+
+            payload = {"id": "9", "application_id": "1", "token": "token", **command("slow")}
+            assert await client.dispatch_within_deadline(payload) == {"type": 5}
+            await asyncio.gather(*client.deferred)
+            await client.close_session()
+            return list(discord.history)
+
+    history = asyncio.run(run())
+    assert [(method, endpoint) for method, endpoint, _ in history] == [
+        ("PATCH", "/webhooks/1/token/messages/@original")
+    ]
+    assert history[0][2]["embeds"][0]["title"] == "hi"
+
+def test_shutdown_abandons_slow_deferred_responses(make_client):
+    async def run():
+        client = make_client(defer_after = 0.01, drain_timeout = 0.1)
+
+        @client.command("stuck")
+        async def stuck(interaction):
+            await asyncio.sleep(60)
+
+        payload = {"id": "9", "application_id": "1", "token": "token", **command("stuck")}
+        await client.dispatch_within_deadline(payload)
+        delivery = next(iter(client.deferred))
+        started = time.monotonic()
+        await client.shutdown()
+        return time.monotonic() - started, delivery
+
+    elapsed, delivery = asyncio.run(run())
+    assert elapsed < 1
+    assert delivery.cancelled()
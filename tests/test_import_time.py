@@ -0,0 +1,16 @@
+import importlib.util
+import os
+
+import pytest
+
+PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "import_time.py")
+spec = importlib.util.spec_from_file_location("import_time", PATH)
+import_time = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(import_time)
+
+@pytest.mark.parametrize("check", sorted(import_time.CHECKS))
+def test_import_stays_within_budget(check):
+    # The best of a few runs, so one slow interpreter start doesn't fail the check.
+    results = [import_time.measure(check) for _ in range(3)]
+    assert all(result["heavy"] == [] for result in results)
+    assert min(result["ms"] for result in results) <= import_time.CHECKS[check]["budget_ms"]
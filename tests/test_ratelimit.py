@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+from gatepoint.ratelimit import RateLimiter, route_key
+
+HEADERS = {
+    "X-RateLimit-Limit": "5",
+    "X-RateLimit-Remaining": "4",
+    "X-RateLimit-Reset-After": "1.0",
+    "X-RateLimit-Bucket": "abcd"
+}
+
+async def hold(bucket, entered: list, release: asyncio.Event):
+    async with bucket:
+        entered.append(bucket)
+        await release.wait()
+
+def test_callers_run_concurrently_while_requests_remain():
+    async def run():
+        limiter = RateLimiter()
+        bucket = limiter.update(limiter.get_bucket("POST", "/channels/1/messages"), "POST", "/channels/1/messages", HEADERS)
+        entered, release = [], asyncio.Event()
+        tasks = [asyncio.ensure_future(hold(bucket, entered, release)) for _ in range(6)]
+        await asyncio.sleep(0.01)
+        # Four requests remain, the rest queue until the bucket resets.
+        assert len(entered) == 4
+        assert bucket.in_flight == 4
+        release.set()
+        for task in tasks:
+            task.cancel()
+
+    asyncio.run(run())
+
+def test_unknown_limits_are_discovered_one_request_at_a_time():
+    async def run():
+        limiter = RateLimiter()
+        bucket = limiter.get_bucket("POST", "/channels/1/messages")
+        entered, release = [], asyncio.Event()
+        tasks = [asyncio.ensure_future(hold(bucket, entered, release)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert len(entered) == 1
+
+        bucket.update(HEADERS)
+        release.set()
+        await asyncio.gather(*tasks)
+        assert len(entered) == 3
+
+    asyncio.run(run())
+
+def test_every_major_parameter_moves_to_the_bucket_hash():
+    limiter = RateLimiter()
+    first = limiter.get_bucket("POST", "/channels/1/messages")
+    second = limiter.get_bucket("POST", "/channels/2/messages")
+    limiter.update(first, "POST", "/channels/1/messages", HEADERS)
+
+    assert limiter.get_bucket("POST", "/channels/2/messages") is second
+    assert set(limiter.buckets) == {"abcd:1", "abcd:2"}
+
+def test_custom_emoji_reactions_share_a_bucket():
+    assert route_key("PUT", "/channels/1/messages/2/reactions/name:123/@me") == \
+        ("PUT /channels/{channels}/messages/{id}/reactions/{emoji}/@me", "1")
+
+    limiter = RateLimiter()
+    first = limiter.get_bucket("PUT", "/channels/1/messages/2/reactions/name:123/@me")
+    limiter.update(first, "PUT", "/channels/1/messages/2/reactions/name:123/@me", HEADERS)
+    second = limiter.get_bucket("PUT", "/channels/1/messages/2/reactions/%F0%9F%91%8D/@me")
+
+    assert second is first
+    assert set(limiter.buckets) == {"abcd:1"}
+
+def test_idle_token_buckets_are_evicted():
+    limiter = RateLimiter()
+    for index in range(100):
+        endpoint = f"/webhooks/1/token{index}/messages/@original"
+        bucket = limiter.get_bucket("PATCH", endpoint)
+        limiter.update(bucket, "PATCH", endpoint, {**HEADERS, "X-RateLimit-Reset-After": "0"})
+
+    busy = limiter.get_bucket("PATCH", "/webhooks/1/busy/messages/@original")
+    busy.reset_at = time.monotonic() + 60
+    assert limiter.sweep() == 100
+    assert list(limiter.buckets.values()) == [busy]
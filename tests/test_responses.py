@@ -0,0 +1,17 @@
+import asyncio
+import json
+
+from gatepoint import Reply
+from gatepoint.codec import JSONCodec
+
+def test_replies_declared_early_use_the_client_codec(make_client):
+    welcome = Reply("Welcome, {name}!")
+    client = make_client(json_backend = "json")
+    assert welcome.render(name = "Ada") == b'{"type":4,"data":{"flags":0,"content":"Welcome, Ada!"}}'
+    assert welcome.codec is client.codec
+
+def test_fixed_responses_use_the_client_codec(make_client):
+    client = make_client()
+    client.codec = JSONCodec(loads = json.loads, dumps = lambda obj: b"custom:" + json.dumps(obj).encode())
+    assert asyncio.run(client.dispatch({"type": 1})) == b'custom:{"type": 1}'
+    assert asyncio.run(client.dispatch({"type": 2, "data": {"name": "missing"}})).startswith(b"custom:")
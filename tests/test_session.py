@@ -0,0 +1,21 @@
+import asyncio
+
+def test_session_is_replaced_in_a_new_event_loop(make_client):
+    client = make_client()
+    first = asyncio.run(client.start_session())
+    # Like a sync from a deploy step followed by serving in another loop.
+    second = asyncio.run(client.start_session())
+
+    assert second is not first
+    assert first.closed
+    assert asyncio.run(client.start_session()) is not second
+
+def test_session_is_reused_within_a_loop(make_client):
+    client = make_client()
+
+    async def run():
+        first = await client.start_session()
+        assert await client.start_session() is first
+        await client.close_session()
+
+    asyncio.run(run())